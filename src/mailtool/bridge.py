@@ -23,6 +23,7 @@ Usage:
 import contextlib
 import re
 import sys
+import time
 import traceback
 from datetime import datetime, timedelta
 
@@ -44,10 +45,84 @@ _SMTP_REGEX = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 # etc. Uses the same half-open MessageClass range trick as list_calendar_events().
 MAIL_ONLY_FILTER = "[MessageClass] >= 'IPM.Note' AND [MessageClass] < 'IPM.Note{'"
 
+# Outlook Restrict filter for unread items, used by list_emails(unread_only=True)
+UNREAD_FILTER = "[UnRead] = True"
+
+# String fields of _mail_item_to_dict() as (dict key, object-model attribute,
+# PT_UNICODE MAPI tag). They are fetched in a single
+# PropertyAccessor.GetProperties round-trip instead of one COM call each.
+_PROPTAG_SCHEMA = "http://schemas.microsoft.com/mapi/proptag/"
+_MAIL_STRING_PROPS = (
+    ("subject", "Subject", "0x0037001F"),
+    ("sender_name", "SenderName", "0x0C1A001F"),
+    ("to", "To", "0x0E04001F"),
+    ("cc", "CC", "0x0E03001F"),
+    ("message_class", "MessageClass", "0x001A001F"),
+)
+
+# PidTagHasAttachments: Outlook's paperclip flag. It stays False when a message
+# only carries inline attachments (e.g. signature images), so both list paths
+# read it rather than Attachments.Count. It rides along in the same
+# GetProperties batch as the string fields, after them.
+_HAS_ATTACHMENTS_SCHEMA = _PROPTAG_SCHEMA + "0x0E1B000B"
+_MAIL_PROP_SCHEMAS = (
+    *(_PROPTAG_SCHEMA + tag for _, _, tag in _MAIL_STRING_PROPS),
+    _HAS_ATTACHMENTS_SCHEMA,
+)
+
+# Columns read by the Table path of list_emails() / search_emails(), in the
+# order _mail_row_to_dict() unpacks them. Built-in names return local times;
+# the two proptag columns are PidTagSenderSmtpAddress and PidTagHasAttachments.
+_MAIL_TABLE_COLUMNS = (
+    "EntryID",
+    "Subject",
+    "SenderName",
+    "SenderEmailType",
+    "SenderEmailAddress",
+    _PROPTAG_SCHEMA + "0x5D01001F",
+    "ReceivedTime",
+    "SentOn",
+    "UnRead",
+    _HAS_ATTACHMENTS_SCHEMA,
+    "MessageClass",
+    "To",
+    "CC",
+    "ConversationID",
+    "ConversationTopic",
+)
+
+# respond_to_meeting() response names -> OlMeetingResponse values
+_MEETING_RESPONSE_CODES = {
+    "accept": 3,  # olMeetingAccepted
+    "decline": 4,  # olMeetingDeclined
+    "tentative": 2,  # olMeetingTentative
+}
+
+# Timestamp format accepted by the appointment methods
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class OutlookBridge:
     """Bridge to Outlook application via COM"""
 
+    # Inbox folder resolved by the MCP lifespan warmup; list_emails() uses it
+    # once in place of a fresh get_inbox() lookup.
+    _warm_inbox = None
+
+    # Folders found by get_folder_by_name(), keyed by the requested name, plus
+    # the calendar and tasks folders (keyed by the tuples below), as
+    # (expiry, folder). Created on first use; cleared when the default account
+    # changes. Entries expire after _FOLDER_CACHE_TTL seconds, so a folder
+    # renamed, deleted or recreated in Outlook is looked up again.
+    _folder_cache = None
+    _FOLDER_CACHE_TTL = 60.0  # seconds
+    _CALENDAR_KEY = ("default", "calendar")
+    _TASKS_KEY = ("default", "tasks")
+
+    # SMTP addresses of Exchange senders, keyed by their legacy DN
+    # (SenderEmailAddress). Created on first use; only hits are stored.
+    _smtp_cache = None
+
     @staticmethod
     def _safe_get_attr(obj, attr, default=None):
         """
@@ -67,6 +142,59 @@ class OutlookBridge:
         except Exception:
             return default
 
+    @staticmethod
+    def _iter_items(items):
+        """
+        Iterate a COM Items collection with GetFirst/GetNext
+
+        With IncludeRecurrences set, Items.Count is not meaningful, so
+        index-based iteration can't be used; Outlook documents
+        GetFirst/GetNext as the way to walk such a collection.
+
+        Args:
+            items: COM Items collection
+
+        Yields:
+            Each item in the collection's current sort order
+        """
+        item = items.GetFirst()
+        while item is not None:
+            yield item
+            item = items.GetNext()
+
+    @staticmethod
+    def _to_datetime(value):
+        """
+        Return a timestamp as a datetime
+
+        The MCP server validates and parses timestamps before calling the
+        bridge; the CLI passes the raw strings.
+
+        Args:
+            value: datetime, or string in TIMESTAMP_FORMAT
+
+        Returns:
+            datetime
+        """
+        if isinstance(value, datetime):
+            return value
+        return datetime.strptime(value, TIMESTAMP_FORMAT)
+
+    @staticmethod
+    def _due_datetime(due_date):
+        """
+        Return a task due date as a datetime
+
+        Args:
+            due_date: datetime (used as-is), or 'YYYY-MM-DD' string
+
+        Returns:
+            datetime at noon on the due date, to avoid timezone boundary issues
+        """
+        if isinstance(due_date, datetime):
+            return due_date
+        return datetime.strptime(f"{due_date} 12:00:00", TIMESTAMP_FORMAT)
+
     def __init__(self, default_account: str | None = None):
         """
         Connect to running Outlook instance or start it
@@ -206,6 +334,9 @@ class OutlookBridge:
             # Set attributes for bridge usage
             self.default_account_name = acc_name
             self.default_root_folder = root
+            # A warmed-up inbox and cached folders belong to the previous account
+            self._warm_inbox = None
+            self._folder_cache = None
             # Also set DefaultStore to help other COM calls that rely on it
             with contextlib.suppress(Exception):
                 self.namespace.DefaultStore = root.Store
@@ -283,7 +414,11 @@ class OutlookBridge:
         return final
 
     def get_calendar(self):
-        """Get the calendar folder"""
+        """Get the calendar folder (resolved once, then cached)"""
+        return self._cached_folder(self._CALENDAR_KEY, self._find_calendar)
+
+    def _find_calendar(self):
+        """Look up the calendar folder; see get_calendar()."""
         # Prefer default account root when set
         root = self._get_root()
         if root:
@@ -323,7 +458,11 @@ class OutlookBridge:
         return None
 
     def get_tasks(self):
-        """Get the tasks folder"""
+        """Get the tasks folder (resolved once, then cached)"""
+        return self._cached_folder(self._TASKS_KEY, self._find_tasks)
+
+    def _find_tasks(self):
+        """Look up the tasks folder; see get_tasks()."""
         root = self._get_root()
         if root:
             try:
@@ -345,15 +484,63 @@ class OutlookBridge:
         """
         Get a folder by name (e.g., "Sent Items", "Archive", etc.)
 
+        Found folders are cached per name, so repeated lookups skip the
+        namespace walk below.
+
         Args:
             folder_name: Name of the folder
 
         Returns:
             Folder object or None
         """
-        # Try default account root first
         if not folder_name:
             return None
+        return self._cached_folder(
+            folder_name, lambda: self._find_folder_by_name(folder_name)
+        )
+
+    def _cached_folder(self, key, find):
+        """
+        Return a folder from _folder_cache, looking it up on a miss
+
+        Misses are not cached, so a folder created later is still found. A hit
+        is checked with one cheap COM read (its Name): if the handle is dead,
+        or a folder cached by name was renamed, it is looked up again.
+
+        Args:
+            key: Cache key
+            find: Callable returning the folder or None
+
+        Returns:
+            Folder object or None
+        """
+        cache = self._folder_cache
+        if cache is None:
+            cache = self._folder_cache = {}
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None and now < entry[0] and self._folder_matches(key, entry[1]):
+            return entry[1]
+        cache.pop(key, None)
+        folder = find()
+        if folder is not None:
+            cache[key] = (now + self._FOLDER_CACHE_TTL, folder)
+        return folder
+
+    @staticmethod
+    def _folder_matches(key, folder):
+        """Check that a cached folder is alive and, if cached by name, not renamed."""
+        try:
+            name = folder.Name
+        except Exception:
+            return False
+        if isinstance(key, str):
+            return str(name).strip().lower() == key.strip().lower()
+        return True
+
+    def _find_folder_by_name(self, folder_name):
+        """Walk the account roots for a folder; see get_folder_by_name()."""
+        # Try default account root first
 
         root = self._get_root()
         if root:
@@ -449,7 +636,13 @@ class OutlookBridge:
             if sender_email_type and sender_email_type != "EX":
                 return raw_address
 
-            # EX path.
+            # EX path. A sender seen before resolves without touching COM.
+            cache = self._smtp_cache
+            if cache is None:
+                cache = self._smtp_cache = {}
+            if raw_address in cache:
+                return cache[raw_address]
+
             sender = self._safe_get_attr(mail_item, "Sender")
             if sender is not None:
                 try:
@@ -459,6 +652,8 @@ class OutlookBridge:
                 if exchange_user is not None:
                     primary = self._safe_get_attr(exchange_user, "PrimarySmtpAddress")
                     if primary:
+                        if raw_address:
+                            cache[raw_address] = primary
                         return primary
 
             # PropertyAccessor: PidTagSenderSmtpAddress (reliable on Outlook 2007+).
@@ -468,6 +663,8 @@ class OutlookBridge:
                     "http://schemas.microsoft.com/mapi/proptag/0x5D01001F"
                 )
                 if smtp:
+                    if raw_address:
+                        cache[raw_address] = smtp
                     return smtp
             except Exception:
                 pass
@@ -481,6 +678,35 @@ class OutlookBridge:
         except Exception:
             return self._safe_get_attr(mail_item, "SenderEmailAddress", "") or ""
 
+    def _smtp_for_exchange_dn(self, dn):
+        """
+        Resolve an Exchange legacy DN to its primary SMTP address
+
+        Each DN is resolved once through the address book
+        (CreateRecipient/Resolve/GetExchangeUser); later calls for the same
+        DN are served from _smtp_cache.
+
+        Args:
+            dn: Exchange legacy DN, as found in SenderEmailAddress
+
+        Returns:
+            SMTP address string, or None if it could not be resolved
+        """
+        cache = self._smtp_cache
+        if cache is None:
+            cache = self._smtp_cache = {}
+        smtp = cache.get(dn)
+        if smtp is None and dn:
+            try:
+                recipient = self.namespace.CreateRecipient(dn)
+                recipient.Resolve()
+                smtp = recipient.AddressEntry.GetExchangeUser().PrimarySmtpAddress
+            except Exception:
+                smtp = None
+            if smtp:
+                cache[dn] = smtp
+        return smtp or None
+
     @staticmethod
     def _format_com_datetime(value):
         """Format a COM/pywintypes datetime to 'YYYY-MM-DD HH:MM:SS' or None.
@@ -583,6 +809,34 @@ class OutlookBridge:
         cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
         return cleaned[:max_chars]
 
+    def _mail_props(self, item):
+        """Read the _MAIL_PROP_SCHEMAS fields of a COM item as a dict.
+
+        Uses one PropertyAccessor.GetProperties call. Properties the item
+        doesn't carry come back from Outlook as error codes and map to ""
+        (or False for has_attachments). If the batch read itself fails, each
+        field is read through the object model instead, with
+        Attachments.Count > 0 standing in for the paperclip flag.
+        """
+        try:
+            values = item.PropertyAccessor.GetProperties(_MAIL_PROP_SCHEMAS)
+            if len(values) != len(_MAIL_PROP_SCHEMAS):
+                raise ValueError("unexpected GetProperties result")
+        except Exception:
+            props = {
+                key: self._safe_get_attr(item, attr, "") or ""
+                for key, attr, _ in _MAIL_STRING_PROPS
+            }
+            props["has_attachments"] = self._attachment_count(item) > 0
+            return props
+        *strings, has_attachments = values
+        props = {
+            key: value if isinstance(value, str) else ""
+            for (key, _, _), value in zip(_MAIL_STRING_PROPS, strings, strict=True)
+        }
+        props["has_attachments"] = has_attachments is True
+        return props
+
     def _mail_item_to_dict(self, item, *, include_body=False):
         """Build an email dict from a COM item using safe accessors throughout.
 
@@ -590,23 +844,22 @@ class OutlookBridge:
         fields that don't exist on the item type come back as defaults instead of
         raising, so callers can branch on 'message_class' rather than catch errors.
         """
-        message_class = (
-            self._safe_get_attr(item, "MessageClass", "IPM.Note") or "IPM.Note"
-        )
+        props = self._mail_props(item)
         d = {
             "entry_id": self._safe_get_attr(item, "EntryID", "") or "",
-            "subject": self._safe_get_attr(item, "Subject", "") or "",
-            "sender": self.resolve_smtp_address(item),
-            "sender_name": self._safe_get_attr(item, "SenderName", "") or "",
+            "subject": props["subject"],
+            # A listing repeats the same few senders; share one string each
+            "sender": sys.intern(self.resolve_smtp_address(item) or ""),
+            "sender_name": sys.intern(props["sender_name"]),
             "received_time": self._format_com_datetime(
                 self._safe_get_attr(item, "ReceivedTime")
             ),
             "sent_time": self._format_com_datetime(self._safe_get_attr(item, "SentOn")),
             "unread": bool(self._safe_get_attr(item, "Unread", False)),
-            "has_attachments": self._attachment_count(item) > 0,
-            "message_class": message_class,
-            "to": self._safe_get_attr(item, "To", "") or "",
-            "cc": self._safe_get_attr(item, "CC", "") or "",
+            "has_attachments": props["has_attachments"],
+            "message_class": props["message_class"] or "IPM.Note",
+            "to": props["to"],
+            "cc": props["cc"],
             "conversation_id": self._safe_get_attr(item, "ConversationID", None),
             "conversation_topic": self._safe_get_attr(item, "ConversationTopic", None),
         }
@@ -618,9 +871,118 @@ class OutlookBridge:
             d["body_top"] = self._clean_body_top(body)
             d["bcc"] = self._safe_get_attr(item, "BCC", "") or ""
             d["attachments"] = self._extract_attachments(item)
+            # Details list every attachment, inline ones included; keep the
+            # flag consistent with the list the caller gets
+            d["has_attachments"] = bool(d["attachments"])
         return d
 
-    def list_emails(self, limit=10, folder="Inbox", include_non_mail=False):
+    def _mail_table(self, folder, limit, filters=(), mail_only=False):
+        """
+        Read email summaries through folder.GetTable()
+
+        A Table returns every _MAIL_TABLE_COLUMNS value of a row in one
+        GetValues() call, instead of one COM round-trip per property.
+
+        Args:
+            folder: Folder to read
+            limit: Maximum number of rows
+            filters: Restrict filters that must all apply
+            mail_only: Also scope to MAIL_ONLY_FILTER (skipped if it fails)
+
+        Returns:
+            List of email dictionaries (newest first), or None if the Table
+            API failed and the caller should read the items instead
+        """
+        try:
+            table = folder.GetTable()
+            if mail_only:
+                with contextlib.suppress(Exception):
+                    table = table.Restrict(MAIL_ONLY_FILTER)
+            for filter_query in filters:
+                table = table.Restrict(filter_query)
+            columns = table.Columns
+            columns.RemoveAll()
+            for column in _MAIL_TABLE_COLUMNS:
+                columns.Add(column)
+            table.Sort("[ReceivedTime]", True)
+            emails = []
+            while len(emails) < limit and not table.EndOfTable:
+                values = table.GetNextRow().GetValues()
+                try:
+                    emails.append(self._mail_row_to_dict(values))
+                except Exception:
+                    # Skip rows that can't be converted
+                    continue
+        except Exception:
+            return None
+        return emails
+
+    @staticmethod
+    def _text(value):
+        """Return value if it is a str, else "" (Table cells can be None or codes)."""
+        return value if isinstance(value, str) else ""
+
+    def _mail_row_to_dict(self, values):
+        """Build a summary dict (as _mail_item_to_dict) from a _mail_table() row."""
+        (
+            entry_id,
+            subject,
+            sender_name,
+            sender_type,
+            sender_address,
+            sender_smtp,
+            received,
+            sent,
+            unread,
+            has_attachments,
+            message_class,
+            to,
+            cc,
+            conversation_id,
+            conversation_topic,
+        ) = values
+        text = self._text
+        entry_id = text(entry_id)
+        sender_type = text(sender_type)
+        sender_address = text(sender_address)
+
+        # Same sources as resolve_smtp_address(), without touching the item:
+        # EX senders with an empty SMTP column are resolved once per DN, and
+        # only open the item if the address book can't resolve them either.
+        if sender_type and sender_type != "EX":
+            sender = sender_address
+        elif text(sender_smtp):
+            sender = sender_smtp
+        else:
+            sender = self._smtp_for_exchange_dn(sender_address)
+            if sender is None:
+                item = self.get_item_by_id(entry_id)
+                if item is not None:
+                    sender = self.resolve_smtp_address(item)
+                else:
+                    match = _SMTP_REGEX.search(sender_address)
+                    sender = match.group(0) if match else sender_address
+
+        return {
+            "entry_id": entry_id,
+            "subject": text(subject),
+            "sender": sys.intern(sender or ""),
+            "sender_name": sys.intern(text(sender_name)),
+            "received_time": self._format_com_datetime(received),
+            "sent_time": self._format_com_datetime(sent),
+            # Missing proptag values come back as integer error codes
+            "unread": unread is True,
+            "has_attachments": has_attachments is True,
+            "message_class": text(message_class) or "IPM.Note",
+            "to": text(to),
+            "cc": text(cc),
+            "conversation_id": text(conversation_id) or None,
+            "conversation_topic": text(conversation_topic) or None,
+        }
+
+    def list_emails(
+        self, limit=10, folder="Inbox", include_non_mail=False, unread_only=False
+    ):
         """
         List emails from the specified folder.
 
@@ -633,13 +995,17 @@ class OutlookBridge:
             folder: Folder name (default: Inbox)
             include_non_mail: If True, also return non-mail items (meeting
                 notifications, post items, etc.)
+            unread_only: If True, only return unread items. The filter is applied
+                by Outlook, so read items are never marshaled over COM.
 
         Returns:
             List of email dictionaries
         """
         # Use get_inbox() for the default Inbox to ensure correct account
         if folder == "Inbox":
-            inbox = self.get_inbox()
+            inbox, self._warm_inbox = self._warm_inbox, None
+            if inbox is None:
+                inbox = self.get_inbox()
         else:
             inbox = self.get_folder_by_name(folder)
             if not inbox:
@@ -648,6 +1014,15 @@ class OutlookBridge:
         if inbox is None:
             return []
 
+        emails = self._mail_table(
+            inbox,
+            limit,
+            filters=(UNREAD_FILTER,) if unread_only else (),
+            mail_only=not include_non_mail,
+        )
+        if emails is not None:
+            return emails
+
         items = inbox.Items
 
         # Filter to real emails (IPM.Note*) unless the caller opts out.
@@ -656,6 +1031,11 @@ class OutlookBridge:
             with contextlib.suppress(Exception):
                 items = items.Restrict(MAIL_ONLY_FILTER)
 
+        # Unlike the mail-only filter there is no safe fallback here: returning
+        # read items would be wrong, so a failing Restrict propagates.
+        if unread_only:
+            items = items.Restrict(UNREAD_FILTER)
+
         # Sort by received time, most recent first
         items.Sort("[ReceivedTime]", True)
 
@@ -730,7 +1110,9 @@ class OutlookBridge:
 
         Args:
             days: Number of days ahead to look
-            all_events: If True, return all events without date filtering
+            all_events: If True, return all events without date filtering.
+                Recurring series are not expanded then: each series is
+                returned once, as its first occurrence.
 
         Returns:
             List of event dictionaries
@@ -745,25 +1127,28 @@ class OutlookBridge:
         )
 
         # CRITICAL: Enable recurrence expansion BEFORE sorting
-        # Must sort ascending for recurrence to work properly
-        items.IncludeRecurrences = True
+        # Must sort ascending for recurrence to work properly.
+        # Expansion is only safe together with the date Restrict below: without
+        # it, recurring meetings without end dates generate infinite items
+        # ("Calendar Bomb"), so all_events lists each series once instead.
+        items.IncludeRecurrences = not all_events
         items.Sort("[Start]")  # Ascending for recurrence
 
         # CRITICAL FIX: Apply Restrict BEFORE iterating to avoid "Calendar Bomb"
-        # Without this, recurring meetings without end dates generate infinite items
         if not all_events:
             start_date = datetime.now()
             end_date = start_date + timedelta(days=days)
             # Jet SQL format for dates: MM/DD/YYYY HH:MM
-            # Use Restrict to filter at COM level before Python iteration
+            # Events starting inside the window; Outlook applies this to the
+            # expanded recurrences, so no Python-side date check is needed
             filter_str = (
-                f"[Start] <= '{end_date.strftime('%m/%d/%Y %H:%M')}' "
-                f"AND [End] >= '{start_date.strftime('%m/%d/%Y %H:%M')}'"
+                f"[Start] >= '{start_date.strftime('%m/%d/%Y %H:%M')}' "
+                f"AND [Start] <= '{end_date.strftime('%m/%d/%Y %H:%M')}'"
             )
             items = items.Restrict(filter_str)
 
         events = []
-        for item in items:
+        for item in self._iter_items(items):
             try:
                 # Use safe attribute access to handle COM errors
                 start = self._safe_get_attr(item, "Start")
@@ -773,39 +1158,6 @@ class OutlookBridge:
                 if not start:
                     continue
 
-                # Additional Python-level filtering for safety (in case Restrict wasn't applied)
-                if not all_events:
-                    start_date = datetime.now()
-                    end_date = start_date + timedelta(days=days)
-                    # Normalize COM/pywintypes datetimes to naive Python datetimes for comparison
-                    start_dt = None
-                    try:
-                        if isinstance(start, datetime):
-                            # drop tzinfo if present to compare with datetime.now()
-                            start_dt = datetime(
-                                start.year,
-                                start.month,
-                                start.day,
-                                start.hour,
-                                start.minute,
-                                start.second,
-                            )
-                        else:
-                            start_dt = datetime(
-                                start.Year,
-                                start.Month,
-                                start.Day,
-                                start.Hour,
-                                start.Minute,
-                                start.Second,
-                            )
-                    except Exception:
-                        # If normalization fails, skip this item
-                        continue
-
-                    if not (start_dt >= start_date and start_dt <= end_date):
-                        continue
-
                 # Get attendees (safe access)
                 required_attendees = self._safe_get_attr(item, "RequiredAttendees", "")
                 optional_attendees = self._safe_get_attr(item, "OptionalAttendees", "")
@@ -1166,8 +1518,8 @@ class OutlookBridge:
             else:
                 appointment = self.outlook.CreateItem(1)  # 1 = olAppointmentItem
             appointment.Subject = subject
-            appointment.Start = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
-            appointment.End = datetime.strptime(end, "%Y-%m-%d %H:%M:%S")
+            appointment.Start = self._to_datetime(start)
+            appointment.End = self._to_datetime(end)
             appointment.Location = location
             appointment.Body = body
             appointment.AllDayEvent = all_day
@@ -1193,7 +1545,7 @@ class OutlookBridge:
         body=None,
     ):
         """
-        Edit an existing appointment
+        Edit an existing appointment (O(1) direct access)
 
         Args:
             entry_id: Appointment entry ID
@@ -1208,27 +1560,26 @@ class OutlookBridge:
         Returns:
             True if successful
         """
-        try:
-            calendar = self.get_calendar()
-            for item in calendar.Items:
-                if item.EntryID == entry_id:
-                    if required_attendees:
-                        item.RequiredAttendees = required_attendees
-                    if optional_attendees:
-                        item.OptionalAttendees = optional_attendees
-                    if subject:
-                        item.Subject = subject
-                    if start:
-                        item.Start = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
-                    if end:
-                        item.End = datetime.strptime(end, "%Y-%m-%d %H:%M:%S")
-                    if location is not None:
-                        item.Location = location
-                    if body is not None:
-                        item.Body = body
-                    item.Save()
-                    return True
+        item = self.get_item_by_id(entry_id)
+        if not item:
             return False
+        try:
+            if required_attendees:
+                item.RequiredAttendees = required_attendees
+            if optional_attendees:
+                item.OptionalAttendees = optional_attendees
+            if subject:
+                item.Subject = subject
+            if start:
+                item.Start = self._to_datetime(start)
+            if end:
+                item.End = self._to_datetime(end)
+            if location is not None:
+                item.Location = location
+            if body is not None:
+                item.Body = body
+            item.Save()
+            return True
         except Exception as e:
             print(f"Error editing appointment: {e}", file=sys.stderr)
             return False
@@ -1315,18 +1666,15 @@ class OutlookBridge:
         Returns:
             True if successful
         """
+        code = _MEETING_RESPONSE_CODES.get(response.lower())
+        if code is None:
+            return False
         item = self.get_item_by_id(entry_id)
         if item:
             try:
-                response_map = {
-                    "accept": 3,  # olResponseAccepted
-                    "decline": 4,  # olResponseDeclined
-                    "tentative": 2,  # olResponseTentative
-                }
-                if response.lower() in response_map:
-                    item.Response(response_map[response.lower()])
-                    item.Send()
-                    return True
+                item.Response(code)
+                item.Send()
+                return True
             except Exception:
                 pass
         return False
@@ -1429,10 +1777,7 @@ class OutlookBridge:
             task.Subject = subject
             task.Body = body
             if due_date:
-                # Use noon to avoid timezone boundary issues
-                task.DueDate = datetime.strptime(
-                    f"{due_date} 12:00:00", "%Y-%m-%d %H:%M:%S"
-                )
+                task.DueDate = self._due_datetime(due_date)
             task.Importance = importance
             task.Save()
             return task.EntryID
@@ -1508,10 +1853,7 @@ class OutlookBridge:
                 if body is not None:
                     item.Body = body
                 if due_date:
-                    # Use noon to avoid timezone boundary issues
-                    item.DueDate = datetime.strptime(
-                        f"{due_date} 12:00:00", "%Y-%m-%d %H:%M:%S"
-                    )
+                    item.DueDate = self._due_datetime(due_date)
                 if importance is not None:
                     item.Importance = importance
                 if percent_complete is not None:
@@ -1612,6 +1954,12 @@ class OutlookBridge:
             elif not include_non_mail:
                 effective_filter = MAIL_ONLY_FILTER
 
+            emails = self._mail_table(
+                folder, limit, filters=(effective_filter,) if effective_filter else ()
+            )
+            if emails is not None:
+                return emails
+
             # Apply restriction filter
             items = items.Restrict(effective_filter)
 
@@ -7,10 +7,48 @@ This module validates the runtime environment before importing the Outlook bridg
 ensuring users get helpful error messages when running on unsupported platforms.
 """
 
-import argparse
+import functools
+import importlib.util
 import json
 import sys
 
+# Help text shown after the top-level command list
+_EPILOG = """\
+Examples:
+  mailtool emails --limit 10
+  mailtool calendar --days 7
+  mailtool send --to user@example.com --subject 'Hello' --body 'World'
+
+For WSL2 users, use ./outlook.sh instead of mailtool directly."""
+
+# Shown when mailtool is run on a platform without Outlook COM
+_PLATFORM_ERROR = """\
+Error: mailtool requires Windows with Microsoft Outlook installed.
+
+This tool uses COM automation to communicate with Outlook and is only supported on Windows.
+
+For WSL2/Linux users:
+  - Use the provided wrapper script: ./outlook.sh <command>
+  - The wrapper automatically bridges to Windows Outlook
+
+For direct Windows access:
+  - Run from Windows PowerShell or Command Prompt
+  - Or use: uv run --with mailtool --no-project mailtool <command>
+"""
+
+# Shown when pywin32 is missing on Windows
+_PYWIN32_ERROR = """\
+Error: pywin32 is required but not installed.
+
+This package provides COM bindings for Outlook automation.
+
+To fix:
+  uv run --with pywin32 mailtool <command>
+
+Or install pywin32 in your environment:
+  uv add pywin32
+"""
+
 
 def _check_platform() -> None:
     """
@@ -20,33 +58,27 @@ def _check_platform() -> None:
         SystemExit: With error code 1 and helpful message if not on Windows.
     """
     if sys.platform != "win32":
-        print(
-            "Error: mailtool requires Windows with Microsoft Outlook installed.\n",
-            file=sys.stderr,
-        )
-        print(
-            "This tool uses COM automation to communicate with Outlook "
-            "and is only supported on Windows.\n",
-            file=sys.stderr,
-        )
-        print("For WSL2/Linux users:", file=sys.stderr)
-        print(
-            "  - Use the provided wrapper script: ./outlook.sh <command>",
-            file=sys.stderr,
-        )
-        print(
-            "  - The wrapper automatically bridges to Windows Outlook\n",
-            file=sys.stderr,
-        )
-        print("For direct Windows access:", file=sys.stderr)
-        print("  - Run from Windows PowerShell or Command Prompt", file=sys.stderr)
-        print(
-            "  - Or use: uv run --with mailtool --no-project mailtool <command>",
-            file=sys.stderr,
-        )
+        sys.stderr.write(_PLATFORM_ERROR)
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _have_pywin32() -> bool:
+    """
+    Check whether pywin32's COM client can be imported.
+
+    The result is cached for the lifetime of the process, so repeated checks
+    do not walk sys.path again.
+
+    Returns:
+        bool: True if win32com.client can be found
+    """
+    try:
+        return importlib.util.find_spec("win32com.client") is not None
+    except (ImportError, ValueError):
+        return False
+
+
 def _check_pywin32() -> None:
     """
     Verify that pywin32 is available on Windows.
@@ -54,30 +86,18 @@ def _check_pywin32() -> None:
     Raises:
         SystemExit: With error code 1 and helpful message if pywin32 is missing.
     """
-    try:
-        import importlib.util
-
-        if importlib.util.find_spec("win32com.client") is None:
-            raise ImportError()
-    except (ImportError, ValueError):
-        print(
-            "Error: pywin32 is required but not installed.\n",
-            file=sys.stderr,
-        )
-        print(
-            "This package provides COM bindings for Outlook automation.\n",
-            file=sys.stderr,
-        )
-        print("To fix:", file=sys.stderr)
-        print(
-            "  uv run --with pywin32 mailtool <command>",
-            file=sys.stderr,
-        )
-        print("\nOr install pywin32 in your environment:", file=sys.stderr)
-        print("  uv add pywin32", file=sys.stderr)
+    if not _have_pywin32():
+        sys.stderr.write(_PYWIN32_ERROR)
         sys.exit(1)
 
 
+def _print_json(obj) -> None:
+    """
+    Print an object as indented JSON on stdout.
+    """
+    print(json.dumps(obj, indent=2))
+
+
 def main() -> None:
     """
     Main CLI entry point for mailtool.
@@ -94,20 +114,13 @@ def main() -> None:
     # Import validation - check pywin32 availability
     _check_pywin32()
 
-    # Now safe to import the bridge (it uses pywin32)
-    from mailtool.bridge import OutlookBridge
+    # Deferred until the environment checks pass (not needed on the error paths)
+    import argparse
 
     # Set up argument parser
     parser = argparse.ArgumentParser(
         description="Outlook COM Bridge - Email and Calendar Automation",
-        epilog=(
-            "Examples:\n"
-            "  mailtool emails --limit 10\n"
-            "  mailtool calendar --days 7\n"
-            "  mailtool send --to user@example.com --subject 'Hello' --body 'World'\n"
-            "\n"
-            "For WSL2 users, use ./outlook.sh instead of mailtool directly."
-        ),
+        epilog=_EPILOG,
     )
     subparsers = parser.add_subparsers(
         dest="command", help="Command to run", required=False
@@ -354,22 +367,34 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
+    # The MCP server creates its own bridge in its lifespan, so hand off before
+    # connecting to Outlook here (avoids a second, unused COM connection)
+    if args.command == "mcp":
+        from mailtool.mcp.server import main as server_main
+
+        # Pass account directly to server_main (bypasses argparse in server)
+        server_main(default_account=getattr(args, "account", None))
+        return
+
+    # Now safe to import the bridge (it uses pywin32)
+    from mailtool.bridge import OutlookBridge
+
     # Initialize bridge (will connect to Outlook)
     bridge = OutlookBridge()
 
     # Command dispatch
     if args.command == "emails":
         emails = bridge.list_emails(limit=args.limit, folder=args.folder)
-        print(json.dumps(emails, indent=2))
+        _print_json(emails)
 
     elif args.command == "calendar":
         events = bridge.list_calendar_events(days=args.days, all_events=args.all)
-        print(json.dumps(events, indent=2))
+        _print_json(events)
 
     elif args.command == "email":
         email = bridge.get_email_body(entry_id=args.id)
         if email:
-            print(json.dumps(email, indent=2))
+            _print_json(email)
         else:
             print("Email not found", file=sys.stderr)
             sys.exit(1)
@@ -435,11 +460,11 @@ def main() -> None:
 
     elif args.command == "search":
         emails = bridge.search_emails(args.query, limit=args.limit)
-        print(json.dumps(emails, indent=2))
+        _print_json(emails)
 
     elif args.command == "folders":
         folders = bridge.list_folders(getattr(args, "account", None))
-        print(json.dumps(folders, indent=2))
+        _print_json(folders)
 
     elif args.command == "set-account":
         ok = bridge.set_default_account(args.name)
@@ -514,7 +539,7 @@ def main() -> None:
     elif args.command == "appointment":
         appointment = bridge.get_appointment(args.id)
         if appointment:
-            print(json.dumps(appointment, indent=2))
+            _print_json(appointment)
         else:
             print("Appointment not found", file=sys.stderr)
             sys.exit(1)
@@ -573,16 +598,16 @@ def main() -> None:
             end_date=getattr(args, "end", None),
             entry_id=getattr(args, "id", None),
         )
-        print(json.dumps(freebusy, indent=2))
+        _print_json(freebusy)
 
     elif args.command == "tasks":
         tasks = bridge.list_tasks()
-        print(json.dumps(tasks, indent=2))
+        _print_json(tasks)
 
     elif args.command == "task":
         task = bridge.get_task(args.id)
         if task:
-            print(json.dumps(task, indent=2))
+            _print_json(task)
         else:
             print("Task not found", file=sys.stderr)
             sys.exit(1)
@@ -637,12 +662,6 @@ def main() -> None:
             print(json.dumps({"status": "error", "message": "Failed to delete task"}))
             sys.exit(1)
 
-    elif args.command == "mcp":
-        from mailtool.mcp.server import main as server_main
-
-        # Pass account directly to server_main (bypasses argparse in server)
-        server_main(default_account=getattr(args, "account", None))
-
 
 if __name__ == "__main__":
     main()
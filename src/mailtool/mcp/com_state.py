@@ -1,6 +1,6 @@
 """COM State Management for MCP Server
 
-This module provides thread-safe COM initialization tracking for the MCP server.
+This module provides lock-free COM initialization tracking for the MCP server.
 COM must be initialized once per thread that accesses COM objects.
 
 This module is shared between server.py and resources.py to ensure consistent
@@ -17,8 +17,17 @@ logger = logging.getLogger(__name__)
 
 # Track which threads have initialized COM
 # COM must be initialized once per thread that accesses COM objects
+# No lock guards this set: add, len and "in" are each a single atomic
+# operation on a builtin set, which is all the helpers below need
 _com_initialized_threads: set[int] = set()
-_com_lock = threading.Lock()
+
+# Per-thread "COM is ready" flag, checked before touching the shared set
+_tls = threading.local()
+
+# Bound once so the init path does plain global lookups, not module attributes
+_GET_IDENT = threading.get_ident
+_CO_INITIALIZE = pythoncom.CoInitialize
+_CO_UNINITIALIZE = pythoncom.CoUninitialize
 
 
 def ensure_com_initialized() -> None:
@@ -33,31 +42,57 @@ def ensure_com_initialized() -> None:
 
     Thread Safety:
         This function is thread-safe. Multiple threads can call it concurrently,
-        and each thread will initialize COM exactly once.
+        and each thread will initialize COM exactly once. Once a thread has
+        initialized COM, later calls return via a thread-local flag. Recording
+        the thread in the shared set relies on set.add being atomic, so no
+        lock is taken.
+    """
+    if getattr(_tls, "ready", False):
+        return
+
+    thread_id = _GET_IDENT()
+    logger.debug("Initializing COM for thread %s", thread_id)
+    _CO_INITIALIZE()
+    _tls.ready = True
+
+    # The shared set only backs the introspection helpers below
+    _com_initialized_threads.add(thread_id)
+    logger.debug("COM initialized for thread %s", thread_id)
+
+
+def release_com_for_thread() -> None:
+    """Balance ensure_com_initialized() for the current thread.
+
+    Calls CoUninitialize once if this module initialized COM on the calling
+    thread, and forgets the thread so a later ensure_com_initialized() starts
+    over. Does nothing on threads this module never initialized.
     """
-    thread_id = threading.get_ident()
+    if not getattr(_tls, "ready", False):
+        return
 
-    with _com_lock:
-        if thread_id not in _com_initialized_threads:
-            logger.debug(f"Initializing COM for thread {thread_id}")
-            pythoncom.CoInitialize()
-            _com_initialized_threads.add(thread_id)
-            logger.debug(f"COM initialized for thread {thread_id}")
+    thread_id = _GET_IDENT()
+    _tls.ready = False
+    _com_initialized_threads.discard(thread_id)
+    _CO_UNINITIALIZE()
+    logger.debug("COM released for thread %s", thread_id)
 
 
 def get_initialized_thread_count() -> int:
     """Get the number of threads that have initialized COM.
 
+    The read is lock-free; len() of a builtin set is atomic.
+
     Returns:
         int: Number of threads with COM initialized
     """
-    with _com_lock:
-        return len(_com_initialized_threads)
+    return len(_com_initialized_threads)
 
 
 def is_com_initialized_for_thread(thread_id: int | None = None) -> bool:
     """Check if COM is initialized for a specific thread.
 
+    The membership test is lock-free; "in" on a builtin set is atomic.
+
     Args:
         thread_id: Thread ID to check (defaults to current thread)
 
@@ -65,7 +100,6 @@ def is_com_initialized_for_thread(thread_id: int | None = None) -> bool:
         bool: True if COM is initialized for the thread
     """
     if thread_id is None:
-        thread_id = threading.get_ident()
+        thread_id = _GET_IDENT()
 
-    with _com_lock:
-        return thread_id in _com_initialized_threads
+    return thread_id in _com_initialized_threads
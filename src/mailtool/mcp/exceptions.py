@@ -12,6 +12,19 @@ ERROR_CODE_NOT_FOUND = -32602  # Item not found
 ERROR_CODE_COM_ERROR = -32603  # COM/bridge error
 ERROR_CODE_VALIDATION_ERROR = -32604  # Validation error
 
+# ErrorData templates, copied with the per-raise fields filled in.
+# model_copy(update=...) skips pydantic validation, which these fields don't need.
+_NOT_FOUND_TEMPLATE = ErrorData(code=ERROR_CODE_NOT_FOUND, message="", data=None)
+_COM_ERROR_TEMPLATE = ErrorData(code=ERROR_CODE_COM_ERROR, message="", data=None)
+_VALIDATION_TEMPLATE = ErrorData(
+    code=ERROR_CODE_VALIDATION_ERROR, message="", data=None
+)
+
+
+def _opt_dict(key: str, value: str | None) -> dict[str, str] | None:
+    """Return {key: value} for ErrorData.data, or None when value is empty."""
+    return {key: value} if value else None
+
 
 class OutlookNotFoundError(McpError):
     """Exception raised when an Outlook item is not found.
@@ -31,15 +44,13 @@ class OutlookNotFoundError(McpError):
             message: Error message describing what was not found
             entry_id: The EntryID that was not found (optional)
         """
-        if entry_id:
-            full_message = f"{message} (EntryID: {entry_id})"
-        else:
-            full_message = message
-
-        error_data = ErrorData(
-            code=ERROR_CODE_NOT_FOUND,
-            message=full_message,
-            data={"entry_id": entry_id} if entry_id else None,
+        full_message = f"{message} (EntryID: {entry_id})" if entry_id else message
+
+        error_data = _NOT_FOUND_TEMPLATE.model_copy(
+            update={
+                "message": full_message,
+                "data": _opt_dict("entry_id", entry_id),
+            }
         )
         super().__init__(error_data)
         self.entry_id = entry_id
@@ -67,15 +78,13 @@ class OutlookComError(McpError):
             message: Error message describing the COM failure
             details: Additional error details (optional)
         """
-        if details:
-            full_message = f"{message}: {details}"
-        else:
-            full_message = message
-
-        error_data = ErrorData(
-            code=ERROR_CODE_COM_ERROR,
-            message=full_message,
-            data={"details": details} if details else None,
+        full_message = f"{message}: {details}" if details else message
+
+        error_data = _COM_ERROR_TEMPLATE.model_copy(
+            update={
+                "message": full_message,
+                "data": _opt_dict("details", details),
+            }
         )
         super().__init__(error_data)
         self.details = details
@@ -103,15 +112,17 @@ class OutlookValidationError(McpError):
             message: Error message describing the validation failure
             field: The field that failed validation (optional)
         """
-        if field:
-            full_message = f"Validation failed for '{field}': {message}"
-        else:
-            full_message = f"Validation failed: {message}"
-
-        error_data = ErrorData(
-            code=ERROR_CODE_VALIDATION_ERROR,
-            message=full_message,
-            data={"field": field} if field else None,
+        full_message = (
+            f"Validation failed for '{field}': {message}"
+            if field
+            else f"Validation failed: {message}"
+        )
+
+        error_data = _VALIDATION_TEMPLATE.model_copy(
+            update={
+                "message": full_message,
+                "data": _opt_dict("field", field),
+            }
         )
         super().__init__(error_data)
         self.field = field
@@ -8,18 +8,87 @@ It handles:
 """
 
 import asyncio
+import functools
 import gc
+import importlib
 import logging
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 import pythoncom
 
 from mailtool.bridge import OutlookBridge
+from mailtool.mcp import resources
+from mailtool.mcp.com_state import release_com_for_thread
 
 # Configure logging for the lifespan manager
 # Logs are written to stderr for debugging and monitoring
 logger = logging.getLogger(__name__)
 
+# Size of the event loop's default executor. COM work stays on the loop
+# thread, so the pool only serves incidental run_in_executor(None, ...) calls.
+THREAD_POOL_SIZE_ENV = "MAILTOOL_THREAD_POOL_SIZE"
+DEFAULT_THREAD_POOL_SIZE = 2
+
+# Warmup retry schedule: 0.1, 0.2, 0.4, 0.8, 1.6 s (capped), each with +/-20% jitter
+WARMUP_MAX_RETRIES = 5
+WARMUP_BASE_DELAY = 0.1  # seconds
+WARMUP_MAX_DELAY = 1.6  # seconds
+
+
+@functools.cache
+def _server_module():
+    """Import mailtool.mcp.server on first use and keep the module
+
+    server imports this module at load time, so it can't be imported at the
+    top of this file.
+
+    Returns:
+        module: The mailtool.mcp.server module
+    """
+    return importlib.import_module("mailtool.mcp.server")
+
+
+def _thread_pool_size() -> int:
+    """Read the default executor size from MAILTOOL_THREAD_POOL_SIZE
+
+    Returns:
+        int: Configured worker count, or DEFAULT_THREAD_POOL_SIZE if the
+            variable is unset or not a positive integer
+    """
+    value = os.environ.get(THREAD_POOL_SIZE_ENV)
+    if not value:
+        return DEFAULT_THREAD_POOL_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        logger.warning(
+            "Ignoring invalid %s=%r, using %s",
+            THREAD_POOL_SIZE_ENV,
+            value,
+            DEFAULT_THREAD_POOL_SIZE,
+        )
+        return DEFAULT_THREAD_POOL_SIZE
+    return size
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff delay to sleep after a failed warmup attempt
+
+    Args:
+        attempt: The 1-based attempt number that just failed
+
+    Returns:
+        float: Delay in seconds, doubling per attempt up to WARMUP_MAX_DELAY,
+            scaled by a random factor in [0.8, 1.2)
+    """
+    delay = min(WARMUP_BASE_DELAY * 2 ** (attempt - 1), WARMUP_MAX_DELAY)
+    return delay * (0.8 + 0.4 * random.random())
+
 
 @asynccontextmanager
 async def outlook_lifespan(app, default_account: str | None = None):
@@ -33,7 +102,9 @@ async def outlook_lifespan(app, default_account: str | None = None):
 
     CRITICAL: COM objects must be created and accessed from the same thread.
     The bridge is created directly in the main async context, not in an executor,
-    to ensure thread affinity for all COM calls.
+    to ensure thread affinity for all COM calls. FastMCP calls synchronous tool
+    and resource functions on the event loop thread, so every later COM call
+    lands in this same apartment without a dedicated COM executor.
 
     Args:
         app: The FastMCP server instance (used to access module state)
@@ -50,24 +121,33 @@ async def outlook_lifespan(app, default_account: str | None = None):
 
     bridge = None
     com_initialized = False
+    gc_was_enabled = gc.isenabled()
+
+    # Replace asyncio's min(32, cpu_count + 4) default pool with a small one
+    executor = ThreadPoolExecutor(
+        max_workers=_thread_pool_size(), thread_name_prefix="mailtool"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
     try:
         # If default_account not provided, read from global variable in server module
         if default_account is None:
-            from mailtool.mcp import server as server_module
-
-            default_account = getattr(server_module, "_default_account", None)
+            default_account = getattr(_server_module(), "_default_account", None)
             if default_account:
                 logger.info(
-                    f"Read default_account from server module: {default_account}"
+                    "Read default_account from server module: %s", default_account
                 )
         elif default_account:
-            logger.info(f"Using provided default_account parameter: {default_account}")
+            logger.info("Using provided default_account parameter: %s", default_account)
 
         # Log lifespan start (using stderr to ensure visibility)
         logger.error("=" * 60)
         logger.error("LIFESPAN: Starting Outlook bridge initialization")
         logger.error("=" * 60)
 
+        # Bridge construction and warmup allocate a burst of short-lived COM
+        # wrappers; keep cyclic GC from sweeping mid-burst (re-enabled below)
+        gc.disable()
+
         # Initialize COM in the main thread BEFORE creating the bridge
         # This ensures all subsequent COM calls happen from the same thread
         logger.info("Initializing COM in main thread...")
@@ -79,57 +159,59 @@ async def outlook_lifespan(app, default_account: str | None = None):
         # NOT in executor - COM objects require thread affinity
         logger.info("Creating Outlook bridge...")
         if default_account:
-            logger.info(f"Using default account: {default_account}")
+            logger.info("Using default account: %s", default_account)
             bridge = OutlookBridge(default_account=default_account)
         else:
             bridge = OutlookBridge()
         logger.info("Outlook bridge created successfully")
 
         # Warmup: Test that COM is responsive with retries
-        max_retries = 5
-        retry_delay = 0.5  # seconds
+        max_retries = WARMUP_MAX_RETRIES
 
         for attempt in range(1, max_retries + 1):
             try:
-                logger.debug(f"Warmup attempt {attempt}/{max_retries}")
+                logger.debug("Warmup attempt %d/%d", attempt, max_retries)
                 # Run a real COM call to ensure Outlook is responsive
                 _warmup_bridge(bridge)
                 logger.info("Outlook bridge warmed up successfully")
                 break  # Success - exit retry loop
             except Exception as e:
-                logger.warning(f"Warmup attempt {attempt}/{max_retries} failed: {e}")
+                logger.warning(
+                    "Warmup attempt %d/%d failed: %s", attempt, max_retries, e
+                )
                 logger.error(
-                    f"Exception traceback:\n{''.join(tb.format_exception(type(e), e, e.__traceback__))}"
+                    "Exception traceback:\n%s",
+                    "".join(tb.format_exception(type(e), e, e.__traceback__)),
                 )
                 if attempt == max_retries:
                     logger.error(
-                        f"Outlook warmup failed after {max_retries} attempts: {e}"
+                        "Outlook warmup failed after %d attempts: %s", max_retries, e
                     )
-                    logger.error(f"Full traceback:\n{''.join(tb.format_exc())}")
+                    logger.error("Full traceback:\n%s", tb.format_exc())
                     raise Exception(
                         f"Outlook warmup failed after {max_retries} attempts: {e}"
                     ) from e
-                # Wait before retry
-                await asyncio.sleep(retry_delay)
+                # Back off before retrying so a slow-starting Outlook isn't polled hard
+                await asyncio.sleep(_retry_delay(attempt))
 
         # Set module-level bridge state for tools to access
-        # Import here to avoid circular imports
-        import mailtool.mcp.server as server_module
+        server_module = _server_module()
 
         # Use setattr to ensure we're setting the module-level variable correctly
         # This modifies the module's __dict__ directly to ensure _get_bridge() sees it
         server_module._bridge = bridge
-        logger.info(f"Bridge set via setattr: {server_module._bridge is not None}")
+        logger.info("Bridge set via setattr: %s", server_module._bridge is not None)
 
         # Set bridge in resources module for resource access
-        from mailtool.mcp import resources
-
         resources._set_bridge(bridge)
         logger.info("Outlook bridge initialized and ready")
         logger.error("=" * 60)
         logger.error("LIFESPAN: Bridge initialization complete, yielding to server")
         logger.error("=" * 60)
 
+        if gc_was_enabled:
+            gc.enable()
+
         # Yield for server to start
         yield
 
@@ -137,21 +219,35 @@ async def outlook_lifespan(app, default_account: str | None = None):
         # Log any unexpected errors during lifespan startup
         logger.error("=" * 60)
         logger.error("LIFESPAN: Unexpected error during startup")
-        logger.error(f"Error: {type(e).__name__}: {e}")
-        logger.error(f"Full traceback:\n{''.join(tb.format_exc())}")
+        logger.error("Error: %s: %s", type(e).__name__, e)
+        logger.error("Full traceback:\n%s", tb.format_exc())
         logger.error("=" * 60)
         raise
     finally:
         # Cleanup: Release COM objects, uninitialize COM, and force garbage collection
         logger.info("Shutting down Outlook bridge...")
+        # Drop every module-level reference to the bridge: the tool and
+        # resource globals and the result caches, whose entries all hold it
+        server_module = _server_module()
+        server_module._bridge = None
+        server_module._clear_caches()
+        resources._set_bridge(None)
+
         if bridge is not None:
-            try:
-                # Release COM references
-                bridge.outlook = None
-                bridge.namespace = None
-                logger.debug("Released COM references")
-            except Exception as e:
-                logger.error(f"Error releasing COM references: {e}")
+            # Release COM references held by the bridge, including cached folders
+            bridge._warm_inbox = None
+            bridge._folder_cache = None
+            bridge.default_root_folder = None
+            bridge.namespace = None
+            bridge.outlook = None
+            logger.debug("Released COM references")
+
+        # Tools and resources run on this thread too; balance their
+        # ensure_com_initialized() before undoing our own CoInitialize
+        try:
+            release_com_for_thread()
+        except Exception as e:
+            logger.error("Error releasing tool COM initialization: %s", e)
 
         # Uninitialize COM for this thread (only if we initialized it)
         if com_initialized:
@@ -159,16 +255,23 @@ async def outlook_lifespan(app, default_account: str | None = None):
                 pythoncom.CoUninitialize()
                 logger.debug("Uninitialized COM")
             except Exception as e:
-                logger.error(f"Error uninitializing COM: {e}")
+                logger.error("Error uninitializing COM: %s", e)
 
         # Force Python garbage collection to release COM objects
+        # (startup may have failed while collection was still disabled)
+        if gc_was_enabled:
+            gc.enable()
         gc.collect()
+        executor.shutdown(wait=False)
         logger.info("Outlook bridge shutdown complete")
 
 
 def _warmup_bridge(bridge: OutlookBridge) -> None:
     """Synchronous warmup function to test COM connectivity
 
+    The inbox folder it resolves is kept on the bridge so the first
+    list_emails() call can reuse it instead of looking it up again.
+
     Args:
         bridge: The OutlookBridge instance to test
 
@@ -179,4 +282,5 @@ def _warmup_bridge(bridge: OutlookBridge) -> None:
     inbox = bridge.get_inbox()
     # Make a real COM call to test connectivity
     count = inbox.Items.Count
-    logger.debug(f"Warmup successful: Inbox has {count} items")
+    logger.debug("Warmup successful: Inbox has %s items", count)
+    bridge._warm_inbox = inbox
@@ -5,7 +5,7 @@ This module contains all Pydantic models for structured output from MCP tools.
 Models provide type safety, automatic schema generation, and descriptive field metadata.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
 # Email Models (US-004)
@@ -15,6 +15,9 @@ from pydantic import BaseModel, Field
 class EmailSummary(BaseModel):
     """Summary representation of an email for list views"""
 
+    # Read-only DTOs built once per email; reject misspelled fields
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     entry_id: str = Field(description="Outlook EntryID for O(1) direct access")
     subject: str = Field(description="Email subject line")
     sender: str = Field(description="SMTP email address of sender")
@@ -63,6 +66,9 @@ class AttachmentInfo(BaseModel):
 class EmailDetails(BaseModel):
     """Full email details including body content."""
 
+    # Read-only DTOs built once per email; reject misspelled fields
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     entry_id: str = Field(description="Outlook EntryID for O(1) direct access")
     subject: str = Field(description="Email subject line")
     sender: str = Field(description="SMTP email address of sender")
@@ -108,6 +114,8 @@ class EmailDetails(BaseModel):
 class SendEmailResult(BaseModel):
     """Result of sending an email or saving a draft"""
 
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(description="Whether the operation succeeded")
     entry_id: str | None = Field(
         default=None, description="EntryID of saved draft (None if sent or failed)"
@@ -123,6 +131,9 @@ class SendEmailResult(BaseModel):
 class AppointmentSummary(BaseModel):
     """Summary representation of a calendar event for list views"""
 
+    # get_appointment results are cached and shared between callers
+    model_config = ConfigDict(frozen=True)
+
     entry_id: str = Field(description="Outlook EntryID for O(1) direct access")
     subject: str = Field(description="Appointment subject line")
     start: str | None = Field(
@@ -162,6 +173,8 @@ class AppointmentDetails(AppointmentSummary):
 class CreateAppointmentResult(BaseModel):
     """Result of creating an appointment"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool = Field(description="Whether the operation succeeded")
     entry_id: str | None = Field(
         default=None, description="EntryID of created appointment (None if failed)"
@@ -199,6 +212,9 @@ class FreeBusyInfo(BaseModel):
 class TaskSummary(BaseModel):
     """Summary representation of a task for list views"""
 
+    # get_task and list_tasks results are cached and shared between callers
+    model_config = ConfigDict(frozen=True)
+
     entry_id: str = Field(description="Outlook EntryID for O(1) direct access")
     subject: str = Field(description="Task subject line")
     body: str = Field(default="", description="Task description/body text")
@@ -223,6 +239,8 @@ class TaskSummary(BaseModel):
 class CreateTaskResult(BaseModel):
     """Result of creating a task"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool = Field(description="Whether the operation succeeded")
     entry_id: str | None = Field(
         default=None, description="EntryID of created task (None if failed)"
@@ -238,6 +256,8 @@ class CreateTaskResult(BaseModel):
 class OperationResult(BaseModel):
     """Generic result for boolean operations (mark, delete, move, complete, etc.)"""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool = Field(description="Whether the operation succeeded")
     message: str = Field(description="Human-readable result message")
 
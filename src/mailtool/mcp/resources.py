@@ -17,32 +17,49 @@ Task resources:
 - tasks://all - List all tasks (including completed)
 """
 
+from __future__ import annotations
+
+import functools
 import logging
+import time
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
-from mcp.server import FastMCP
-
 from mailtool.mcp.com_state import ensure_com_initialized
 from mailtool.mcp.exceptions import OutlookComError
 from mailtool.mcp.models import (
-    AppointmentDetails,
-    AppointmentSummary,
+    AttachmentInfo,
     EmailDetails,
     EmailSummary,
-    TaskSummary,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from mcp.server import FastMCP
+
     from mailtool.bridge import OutlookBridge
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Module-level bridge instance (set by server.py)
-_bridge: "OutlookBridge | None" = None
+# Bridge instance for the current context (set by the lifespan via _set_bridge).
+# Request handlers run in tasks spawned after the lifespan has entered, so they
+# inherit the value; tests can swap it per context without touching a global.
+_bridge_var: ContextVar[OutlookBridge | None] = ContextVar(
+    "mailtool_resources_bridge", default=None
+)
+
 
+# Short-lived cache of rendered resource text, keyed by resource URI and bound
+# to the bridge that produced it: clients often re-read the same resource
+# several times in quick succession. Entries are dropped by the tools that change a resource's content (see
+# _invalidate_resources) and whenever a new bridge is set.
+_RESOURCE_CACHE_TTL = 2.0  # seconds
+_resource_cache: dict[str, tuple[float, OutlookBridge, str]] = {}
 
-def _get_bridge() -> "OutlookBridge":
+
+def _get_bridge() -> OutlookBridge:
     """Get the current bridge instance.
 
     Returns:
@@ -51,47 +68,168 @@ def _get_bridge() -> "OutlookBridge":
     Raises:
         OutlookComError: If bridge is not initialized
     """
-    global _bridge
-
     # Ensure COM is initialized for the current thread before accessing bridge
     ensure_com_initialized()
 
-    if _bridge is None:
+    bridge = _bridge_var.get()
+    if bridge is None:
         raise OutlookComError("Outlook bridge not initialized")
-    return _bridge
+    return bridge
 
 
-def _set_bridge(bridge: "OutlookBridge") -> None:
+def _set_bridge(bridge: OutlookBridge) -> None:
     """Set the bridge instance (called by server.py lifespan).
 
     Args:
         bridge: The bridge instance
     """
-    global _bridge
-    _bridge = bridge
+    _bridge_var.set(bridge)
+    _resource_cache.clear()
 
 
-def _format_email_summary(email: EmailSummary) -> str:
+def _cached(uri: str) -> Callable[[Callable[[], str]], Callable[[], str]]:
+    """Decorate a resource function to reuse its text for _RESOURCE_CACHE_TTL.
+
+    The bridge is resolved before the cache is consulted, so an uninitialized
+    bridge raises on every call, and text rendered for one bridge is never
+    served to a context holding another.
+
+    Args:
+        uri: Resource URI used as the cache key
+
+    Returns:
+        Decorator wrapping a zero-argument resource function
+    """
+
+    def decorator(func: Callable[[], str]) -> Callable[[], str]:
+        @functools.wraps(func)
+        def wrapper() -> str:
+            bridge = _get_bridge()
+            now = time.monotonic()
+            entry = _resource_cache.get(uri)
+            if (
+                entry is not None
+                and entry[1] is bridge
+                and now - entry[0] < _RESOURCE_CACHE_TTL
+            ):
+                return entry[2]
+            text = func()
+            _resource_cache[uri] = (now, bridge, text)
+            return text
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_resources(scheme: str) -> None:
+    """Drop cached text for every resource under a URI scheme.
+
+    Args:
+        scheme: URI scheme prefix, e.g. "inbox://", "calendar://" or "tasks://"
+    """
+    for uri in [uri for uri in _resource_cache if uri.startswith(scheme)]:
+        del _resource_cache[uri]
+
+
+# "Yes"/"No" labels indexed by a bool (bool is an int subclass)
+_YN = ("No", "Yes")
+
+# Rule placed after each item in the list resources, and the same rule with
+# its surrounding newlines for joining formatted items in one pass
+_SEP = "-" * 60
+_SEP_JOIN = f"\n{_SEP}\n"
+
+
+def _render_list(
+    items: list[dict],
+    formatter: Callable[[dict], str],
+    header: str,
+    empty_message: str,
+) -> str:
+    """Render a list resource: a counted header, then each item and a rule.
+
+    Args:
+        items: Item dicts as returned by the bridge
+        formatter: Formats one item dict as text
+        header: Header template; {n} is replaced by the item count
+        empty_message: Text returned when there are no items
+
+    Returns:
+        Formatted text for the whole list
+    """
+    if not items:
+        return empty_message
+
+    body = _SEP_JOIN.join(map(formatter, items))
+    return f"{header.format(n=len(items))}\n\n{body}\n{_SEP}"
+
+
+# Email text templates, formatted with a prepared mapping via str.format_map
+_EMAIL_SUMMARY_FORMAT = """Subject: {subject}
+From: {sender_name} <{sender}>
+To: {to}
+CC: {cc}
+Received: {received_time}
+Sent: {sent_time}
+Unread: {unread}
+Attachments: {has_attachments}
+MessageClass: {message_class}
+Conversation: {conversation_topic} [{conversation_id}]
+Entry ID: {entry_id}
+""".format_map
+
+_EMAIL_DETAILS_FORMAT = """Subject: {subject}
+From: {sender_name} <{sender}>
+To: {to}
+CC: {cc}
+Received: {received_time}
+Sent: {sent_time}
+Attachments: {has_attachments}
+MessageClass: {message_class}
+Conversation: {conversation_topic} [{conversation_id}]
+Entry ID: {entry_id}
+
+Attachments:
+{attachment_lines}
+
+Body (top message):
+{body_top}
+
+Body (full):
+{body}
+""".format_map
+
+
+def _format_email_summary(email: dict) -> str:
     """Format an email summary as readable text.
 
+    Takes the bridge's email dict directly (no EmailSummary round-trip);
+    optional keys fall back to the EmailSummary defaults.
+
     Args:
-        email: EmailSummary model
+        email: Email dict as returned by OutlookBridge.list_emails
 
     Returns:
         Formatted text representation
     """
-    return f"""Subject: {email.subject}
-From: {email.sender_name} <{email.sender}>
-To: {email.to or "(none)"}
-CC: {email.cc or "(none)"}
-Received: {email.received_time}
-Sent: {email.sent_time}
-Unread: {"Yes" if email.unread else "No"}
-Attachments: {"Yes" if email.has_attachments else "No"}
-MessageClass: {email.message_class}
-Conversation: {email.conversation_topic or "(none)"} [{email.conversation_id or "-"}]
-Entry ID: {email.entry_id}
-"""
+    return _EMAIL_SUMMARY_FORMAT(
+        {
+            "subject": email["subject"],
+            "sender_name": email["sender_name"],
+            "sender": email["sender"],
+            "to": email.get("to") or "(none)",
+            "cc": email.get("cc") or "(none)",
+            "received_time": email["received_time"],
+            "sent_time": email.get("sent_time"),
+            "unread": _YN[email["unread"]],
+            "has_attachments": _YN[email["has_attachments"]],
+            "message_class": email.get("message_class", "IPM.Note"),
+            "conversation_topic": email.get("conversation_topic") or "(none)",
+            "conversation_id": email.get("conversation_id") or "-",
+            "entry_id": email["entry_id"],
+        }
+    )
 
 
 def _format_email_details(email: EmailDetails) -> str:
@@ -111,82 +249,55 @@ def _format_email_details(email: EmailDetails) -> str:
         if email.attachments
         else "  (none)"
     )
-    return f"""Subject: {email.subject}
-From: {email.sender_name} <{email.sender}>
-To: {email.to or "(none)"}
-CC: {email.cc or "(none)"}
-Received: {email.received_time}
-Sent: {email.sent_time}
-Attachments: {"Yes" if email.has_attachments else "No"}
-MessageClass: {email.message_class}
-Conversation: {email.conversation_topic or "(none)"} [{email.conversation_id or "-"}]
-Entry ID: {email.entry_id}
-
-Attachments:
-{attachment_lines}
-
-Body (top message):
-{email.body_top}
-
-Body (full):
-{email.body}
-"""
+    return _EMAIL_DETAILS_FORMAT(
+        {
+            "subject": email.subject,
+            "sender_name": email.sender_name,
+            "sender": email.sender,
+            "to": email.to or "(none)",
+            "cc": email.cc or "(none)",
+            "received_time": email.received_time,
+            "sent_time": email.sent_time,
+            "has_attachments": _YN[email.has_attachments],
+            "message_class": email.message_class,
+            "conversation_topic": email.conversation_topic or "(none)",
+            "conversation_id": email.conversation_id or "-",
+            "entry_id": email.entry_id,
+            "attachment_lines": attachment_lines,
+            "body_top": email.body_top,
+            "body": email.body,
+        }
+    )
 
 
 def _email_summary_to_dict(email: EmailSummary) -> dict:
     """Convert EmailSummary to dict for JSON serialization.
 
+    The model's fields are exactly the wire keys, so pydantic-core dumps it
+    in one call.
+
     Args:
         email: EmailSummary model
 
     Returns:
         Dictionary representation
     """
-    return {
-        "entry_id": email.entry_id,
-        "subject": email.subject,
-        "sender": email.sender,
-        "sender_name": email.sender_name,
-        "received_time": email.received_time,
-        "unread": email.unread,
-        "has_attachments": email.has_attachments,
-        "message_class": email.message_class,
-        "to": email.to,
-        "cc": email.cc,
-        "sent_time": email.sent_time,
-        "conversation_id": email.conversation_id,
-        "conversation_topic": email.conversation_topic,
-    }
+    return email.model_dump()
 
 
 def _email_details_to_dict(email: EmailDetails) -> dict:
     """Convert EmailDetails to dict for JSON serialization.
 
+    The model's fields are exactly the wire keys (attachments dump as dicts),
+    so pydantic-core dumps it in one call.
+
     Args:
         email: EmailDetails model
 
     Returns:
         Dictionary representation
     """
-    return {
-        "entry_id": email.entry_id,
-        "subject": email.subject,
-        "sender": email.sender,
-        "sender_name": email.sender_name,
-        "body": email.body,
-        "html_body": email.html_body,
-        "body_top": email.body_top,
-        "received_time": email.received_time,
-        "sent_time": email.sent_time,
-        "has_attachments": email.has_attachments,
-        "message_class": email.message_class,
-        "to": email.to,
-        "cc": email.cc,
-        "bcc": email.bcc,
-        "conversation_id": email.conversation_id,
-        "conversation_topic": email.conversation_topic,
-        "attachments": [a.model_dump() for a in email.attachments],
-    }
+    return email.model_dump()
 
 
 def register_email_resources(mcp: FastMCP) -> None:
@@ -207,6 +318,7 @@ def register_email_resources(mcp: FastMCP) -> None:
         title="Inbox Emails",
         description="List recent emails from the inbox (max 50)",
     )
+    @_cached("inbox://emails")
     def inbox_emails() -> str:
         """Get recent emails from inbox.
 
@@ -215,33 +327,15 @@ def register_email_resources(mcp: FastMCP) -> None:
         """
         bridge = _get_bridge()
 
-        # Get emails from bridge
-        emails_data = bridge.list_emails(limit=50, folder="Inbox")
-
-        # Convert to EmailSummary models
-        emails = [
-            EmailSummary(
-                entry_id=email["entry_id"],
-                subject=email["subject"],
-                sender=email["sender"],
-                sender_name=email["sender_name"],
-                received_time=email["received_time"],
-                unread=email["unread"],
-                has_attachments=email["has_attachments"],
-            )
-            for email in emails_data
-        ]
-
-        # Format as text
-        if not emails:
-            return "No emails found in inbox"
-
-        lines = [f"Inbox Emails ({len(emails)} items)", ""]
-        for email in emails:
-            lines.append(_format_email_summary(email))
-            lines.append("-" * 60)
+        # Get emails from bridge; the dicts are formatted directly
+        emails = bridge.list_emails(limit=50, folder="Inbox")
 
-        return "\n".join(lines)
+        return _render_list(
+            emails,
+            _format_email_summary,
+            "Inbox Emails ({n} items)",
+            "No emails found in inbox",
+        )
 
     @mcp.resource(
         uri="inbox://unread",
@@ -249,6 +343,7 @@ def register_email_resources(mcp: FastMCP) -> None:
         title="Unread Inbox Emails",
         description="List unread emails from the inbox (max 50)",
     )
+    @_cached("inbox://unread")
     def inbox_unread() -> str:
         """Get unread emails from inbox.
 
@@ -257,38 +352,15 @@ def register_email_resources(mcp: FastMCP) -> None:
         """
         bridge = _get_bridge()
 
-        # Get all emails from bridge
-        emails_data = bridge.list_emails(limit=50, folder="Inbox")
-
-        # Filter to only unread emails
-        unread_emails_data = [
-            email for email in emails_data if email.get("unread", False)
-        ]
-
-        # Convert to EmailSummary models
-        emails = [
-            EmailSummary(
-                entry_id=email["entry_id"],
-                subject=email["subject"],
-                sender=email["sender"],
-                sender_name=email["sender_name"],
-                received_time=email["received_time"],
-                unread=email["unread"],
-                has_attachments=email["has_attachments"],
-            )
-            for email in unread_emails_data
-        ]
+        # Outlook filters to unread items; the dicts are formatted directly
+        emails = bridge.list_emails(limit=50, folder="Inbox", unread_only=True)
 
-        # Format as text
-        if not emails:
-            return "No unread emails in inbox"
-
-        lines = [f"Unread Emails ({len(emails)} items)", ""]
-        for email in emails:
-            lines.append(_format_email_summary(email))
-            lines.append("-" * 60)
-
-        return "\n".join(lines)
+        return _render_list(
+            emails,
+            _format_email_summary,
+            "Unread Emails ({n} items)",
+            "No unread emails in inbox",
+        )
 
     @mcp.resource(
         uri="email://{entry_id}",
@@ -316,69 +388,92 @@ def register_email_resources(mcp: FastMCP) -> None:
         if email_data is None:
             return f"Email not found: {entry_id}"
 
-        # Convert to EmailDetails model
-        email = EmailDetails(
-            entry_id=email_data["entry_id"],
-            subject=email_data["subject"],
-            sender=email_data["sender"],
-            sender_name=email_data["sender_name"],
-            body=email_data["body"],
-            html_body=email_data["html_body"],
-            received_time=email_data["received_time"],
-            has_attachments=email_data["has_attachments"],
+        # Bridge dicts are already well-typed; skip pydantic validation
+        email = EmailDetails.model_construct(
+            **{
+                **email_data,
+                "attachments": [
+                    AttachmentInfo.model_construct(**a)
+                    for a in email_data.get("attachments", ())
+                ],
+            }
         )
 
         # Format as text
         return _format_email_details(email)
 
 
-def _format_appointment_summary(appt: AppointmentSummary) -> str:
+# Appointment text templates; the details layout adds the body after the summary
+_APPOINTMENT_SUMMARY_TEMPLATE = """Subject: {subject}
+Start: {start}
+End: {end}
+Location: {location}
+Organizer: {organizer}
+All Day: {all_day}
+Required Attendees: {required_attendees}
+Optional Attendees: {optional_attendees}
+Response Status: {response_status}
+Meeting Status: {meeting_status}
+Entry ID: {entry_id}
+"""
+_APPOINTMENT_SUMMARY_FORMAT = _APPOINTMENT_SUMMARY_TEMPLATE.format_map
+_APPOINTMENT_DETAILS_FORMAT = (
+    _APPOINTMENT_SUMMARY_TEMPLATE
+    + """
+Body:
+{body}
+"""
+).format_map
+
+
+def _appointment_fields(appt: dict) -> dict[str, object]:
+    """Build the template mapping shared by the appointment formatters.
+
+    Args:
+        appt: Appointment dict as returned by the bridge
+
+    Returns:
+        Field values with display fallbacks applied
+    """
+    return {
+        "subject": appt["subject"],
+        "start": appt["start"],
+        "end": appt["end"],
+        "location": appt["location"] or "No location",
+        "organizer": appt["organizer"] or "Unknown",
+        "all_day": _YN[appt["all_day"]],
+        "required_attendees": appt["required_attendees"] or "None",
+        "optional_attendees": appt["optional_attendees"] or "None",
+        "response_status": appt["response_status"] or "N/A",
+        "meeting_status": appt["meeting_status"] or "N/A",
+        "entry_id": appt["entry_id"],
+    }
+
+
+def _format_appointment_summary(appt: dict) -> str:
     """Format an appointment summary as readable text.
 
     Args:
-        appt: AppointmentSummary model
+        appt: Event dict as returned by OutlookBridge.list_calendar_events
 
     Returns:
         Formatted text representation
     """
-    return f"""Subject: {appt.subject}
-Start: {appt.start}
-End: {appt.end}
-Location: {appt.location or "No location"}
-Organizer: {appt.organizer or "Unknown"}
-All Day: {"Yes" if appt.all_day else "No"}
-Required Attendees: {appt.required_attendees or "None"}
-Optional Attendees: {appt.optional_attendees or "None"}
-Response Status: {appt.response_status or "N/A"}
-Meeting Status: {appt.meeting_status or "N/A"}
-Entry ID: {appt.entry_id}
-"""
+    return _APPOINTMENT_SUMMARY_FORMAT(_appointment_fields(appt))
 
 
-def _format_appointment_details(appt: AppointmentDetails) -> str:
+def _format_appointment_details(appt: dict) -> str:
     """Format full appointment details as readable text.
 
     Args:
-        appt: AppointmentDetails model
+        appt: Appointment dict as returned by OutlookBridge.get_appointment
 
     Returns:
         Formatted text representation with body
     """
-    return f"""Subject: {appt.subject}
-Start: {appt.start}
-End: {appt.end}
-Location: {appt.location or "No location"}
-Organizer: {appt.organizer or "Unknown"}
-All Day: {"Yes" if appt.all_day else "No"}
-Required Attendees: {appt.required_attendees or "None"}
-Optional Attendees: {appt.optional_attendees or "None"}
-Response Status: {appt.response_status or "N/A"}
-Meeting Status: {appt.meeting_status or "N/A"}
-Entry ID: {appt.entry_id}
-
-Body:
-{appt.body or "No body text"}
-"""
+    fields = _appointment_fields(appt)
+    fields["body"] = appt["body"] or "No body text"
+    return _APPOINTMENT_DETAILS_FORMAT(fields)
 
 
 def register_calendar_resources(mcp: FastMCP) -> None:
@@ -398,6 +493,7 @@ def register_calendar_resources(mcp: FastMCP) -> None:
         title="Today's Calendar",
         description="List calendar events for today",
     )
+    @_cached("calendar://today")
     def calendar_today() -> str:
         """Get today's calendar events.
 
@@ -407,37 +503,14 @@ def register_calendar_resources(mcp: FastMCP) -> None:
         bridge = _get_bridge()
 
         # Get today's events from bridge (days=1)
-        events_data = bridge.list_calendar_events(days=1)
-
-        # Convert to AppointmentSummary models
-        events = [
-            AppointmentSummary(
-                entry_id=event["entry_id"],
-                subject=event["subject"],
-                start=event["start"],
-                end=event["end"],
-                location=event["location"],
-                organizer=event["organizer"],
-                all_day=event["all_day"],
-                required_attendees=event["required_attendees"],
-                optional_attendees=event["optional_attendees"],
-                response_status=event["response_status"],
-                meeting_status=event["meeting_status"],
-                response_requested=event["response_requested"],
-            )
-            for event in events_data
-        ]
+        events = bridge.list_calendar_events(days=1)
 
-        # Format as text
-        if not events:
-            return "No calendar events for today"
-
-        lines = [f"Today's Calendar ({len(events)} events)", ""]
-        for event in events:
-            lines.append(_format_appointment_summary(event))
-            lines.append("-" * 60)
-
-        return "\n".join(lines)
+        return _render_list(
+            events,
+            _format_appointment_summary,
+            "Today's Calendar ({n} events)",
+            "No calendar events for today",
+        )
 
     @mcp.resource(
         uri="calendar://week",
@@ -445,6 +518,7 @@ def register_calendar_resources(mcp: FastMCP) -> None:
         title="Week's Calendar",
         description="List calendar events for the next 7 days",
     )
+    @_cached("calendar://week")
     def calendar_week() -> str:
         """Get calendar events for the next 7 days.
 
@@ -454,78 +528,77 @@ def register_calendar_resources(mcp: FastMCP) -> None:
         bridge = _get_bridge()
 
         # Get this week's events from bridge (days=7)
-        events_data = bridge.list_calendar_events(days=7)
-
-        # Convert to AppointmentSummary models
-        events = [
-            AppointmentSummary(
-                entry_id=event["entry_id"],
-                subject=event["subject"],
-                start=event["start"],
-                end=event["end"],
-                location=event["location"],
-                organizer=event["organizer"],
-                all_day=event["all_day"],
-                required_attendees=event["required_attendees"],
-                optional_attendees=event["optional_attendees"],
-                response_status=event["response_status"],
-                meeting_status=event["meeting_status"],
-                response_requested=event["response_requested"],
-            )
-            for event in events_data
-        ]
+        events = bridge.list_calendar_events(days=7)
+
+        return _render_list(
+            events,
+            _format_appointment_summary,
+            "Week's Calendar ({n} events)",
+            "No calendar events for the next 7 days",
+        )
 
-        # Format as text
-        if not events:
-            return "No calendar events for the next 7 days"
 
-        lines = [f"Week's Calendar ({len(events)} events)", ""]
-        for event in events:
-            lines.append(_format_appointment_summary(event))
-            lines.append("-" * 60)
+# Outlook task status (OlTaskStatus) and importance (OlImportance) names,
+# indexed by their integer codes
+_TASK_STATUS_NAMES = (
+    "Not Started",
+    "In Progress",
+    "Complete",
+    "Waiting",
+    "Deferred",
+    "Other",
+)
+_TASK_PRIORITY_NAMES = ("Low", "Normal", "High")
+
+_TASK_SUMMARY_FORMAT = """Subject: {subject}
+Due Date: {due_date}
+Status: {status}
+Priority: {priority}
+Complete: {complete}
+Percent Complete: {percent_complete:.1f}%
+Entry ID: {entry_id}
+""".format_map
+
+
+def _code_name(names: tuple[str, ...], code: int | None) -> str:
+    """Look up the name for an Outlook enum code.
 
-        return "\n".join(lines)
+    Args:
+        names: Names indexed by code
+        code: The code, or None if the item has none
+
+    Returns:
+        The name, "Unknown" for an out-of-range code, or "N/A" for None
+    """
+    if code is None:
+        return "N/A"
+    return names[code] if 0 <= code < len(names) else "Unknown"
 
 
-def _format_task_summary(task: TaskSummary) -> str:
+def _format_task_summary(task: dict) -> str:
     """Format a task summary as readable text.
 
     Args:
-        task: TaskSummary model
+        task: Task dict as returned by OutlookBridge.list_tasks
 
     Returns:
         Formatted text representation
     """
-    # Map status codes to human-readable names
-    status_map = {
-        0: "Not Started",
-        1: "In Progress",
-        2: "Complete",
-        3: "Waiting",
-        4: "Deferred",
-        5: "Other",
-    }
-    status_str = (
-        status_map.get(task.status, "Unknown") if task.status is not None else "N/A"
+    status_str = _code_name(_TASK_STATUS_NAMES, task["status"])
+    priority_str = _code_name(_TASK_PRIORITY_NAMES, task["priority"])
+
+    return _TASK_SUMMARY_FORMAT(
+        {
+            "subject": task["subject"],
+            "due_date": task["due_date"] or "No due date",
+            "status": status_str,
+            "priority": priority_str,
+            "complete": _YN[task["complete"]],
+            "percent_complete": task["percent_complete"],
+            "entry_id": task["entry_id"],
+        }
     )
 
-    # Map priority codes to human-readable names
-    priority_map = {0: "Low", 1: "Normal", 2: "High"}
-    priority_str = (
-        priority_map.get(task.priority, "Unknown")
-        if task.priority is not None
-        else "N/A"
-    )
-
-    return f"""Subject: {task.subject}
-Due Date: {task.due_date or "No due date"}
-Status: {status_str}
-Priority: {priority_str}
-Complete: {"Yes" if task.complete else "No"}
-Percent Complete: {task.percent_complete:.1f}%
-Entry ID: {task.entry_id}
-"""
-
 
 def register_task_resources(mcp: FastMCP) -> None:
     """Register all task resources with the FastMCP server.
@@ -544,6 +617,7 @@ def register_task_resources(mcp: FastMCP) -> None:
         title="Active Tasks",
         description="List active (incomplete) tasks",
     )
+    @_cached("tasks://active")
     def tasks_active() -> str:
         """Get active (incomplete) tasks.
 
@@ -553,33 +627,11 @@ def register_task_resources(mcp: FastMCP) -> None:
         bridge = _get_bridge()
 
         # Get active tasks from bridge (include_completed=False)
-        tasks_data = bridge.list_tasks(include_completed=False)
-
-        # Convert to TaskSummary models
-        tasks = [
-            TaskSummary(
-                entry_id=task["entry_id"],
-                subject=task["subject"],
-                body=task["body"],
-                due_date=task["due_date"],
-                status=task["status"],
-                priority=task["priority"],
-                complete=task["complete"],
-                percent_complete=task["percent_complete"],
-            )
-            for task in tasks_data
-        ]
-
-        # Format as text
-        if not tasks:
-            return "No active tasks"
-
-        lines = [f"Active Tasks ({len(tasks)} items)", ""]
-        for task in tasks:
-            lines.append(_format_task_summary(task))
-            lines.append("-" * 60)
+        tasks = bridge.list_tasks(include_completed=False)
 
-        return "\n".join(lines)
+        return _render_list(
+            tasks, _format_task_summary, "Active Tasks ({n} items)", "No active tasks"
+        )
 
     @mcp.resource(
         uri="tasks://all",
@@ -587,6 +639,7 @@ def register_task_resources(mcp: FastMCP) -> None:
         title="All Tasks",
         description="List all tasks (including completed)",
     )
+    @_cached("tasks://all")
     def tasks_all() -> str:
         """Get all tasks (including completed).
 
@@ -596,30 +649,8 @@ def register_task_resources(mcp: FastMCP) -> None:
         bridge = _get_bridge()
 
         # Get all tasks from bridge (include_completed=True)
-        tasks_data = bridge.list_tasks(include_completed=True)
-
-        # Convert to TaskSummary models
-        tasks = [
-            TaskSummary(
-                entry_id=task["entry_id"],
-                subject=task["subject"],
-                body=task["body"],
-                due_date=task["due_date"],
-                status=task["status"],
-                priority=task["priority"],
-                complete=task["complete"],
-                percent_complete=task["percent_complete"],
-            )
-            for task in tasks_data
-        ]
+        tasks = bridge.list_tasks(include_completed=True)
 
-        # Format as text
-        if not tasks:
-            return "No tasks found"
-
-        lines = [f"All Tasks ({len(tasks)} items)", ""]
-        for task in tasks:
-            lines.append(_format_task_summary(task))
-            lines.append("-" * 60)
-
-        return "\n".join(lines)
+        return _render_list(
+            tasks, _format_task_summary, "All Tasks ({n} items)", "No tasks found"
+        )
@@ -8,14 +8,28 @@ The server provides 25 tools and 7 resources for Outlook email, calendar, and ta
 All tools return structured Pydantic models for type safety and LLM understanding.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import logging
-from typing import TYPE_CHECKING
+import os
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import TYPE_CHECKING, get_args
 
 from mcp.server import FastMCP
+from pydantic import TypeAdapter
 
+from mailtool.bridge import TIMESTAMP_FORMAT
 from mailtool.mcp.com_state import ensure_com_initialized
-from mailtool.mcp.exceptions import OutlookComError, OutlookNotFoundError
+from mailtool.mcp.exceptions import (
+    OutlookComError,
+    OutlookNotFoundError,
+    OutlookValidationError,
+)
 from mailtool.mcp.lifespan import outlook_lifespan
 from mailtool.mcp.models import (
     AppointmentDetails,
@@ -32,6 +46,7 @@ from mailtool.mcp.models import (
     TaskSummary,
 )
 from mailtool.mcp.resources import (
+    _invalidate_resources,
     register_calendar_resources,
     register_email_resources,
     register_task_resources,
@@ -63,7 +78,239 @@ register_calendar_resources(mcp)
 register_task_resources(mcp)
 
 # Module-level bridge instance (set by lifespan, accessed by tools)
-_bridge: "OutlookBridge | None" = None
+_bridge: OutlookBridge | None = None
+
+# Short-lived cache of search_emails / list_unread_emails results: agents tend
+# to repeat the same query several times in a row. Keys are the query with
+# whitespace collapsed outside quoted literals (_filter_key), the limit and include_non_mail, so both tools share
+# entries for the same Restrict filter. Entries remember the bridge they came
+# from and are dropped by the tools that change the inbox
+# (_invalidate_searches). MAILTOOL_SEARCH_TTL sets the lifetime in seconds;
+# 0 disables the cache.
+SEARCH_TTL_ENV = "MAILTOOL_SEARCH_TTL"
+DEFAULT_SEARCH_TTL = 2.0  # seconds
+_SEARCH_CACHE_SIZE = 64
+_search_cache: OrderedDict[
+    tuple[str, int, bool], tuple[float, OutlookBridge, list[EmailSummary]]
+] = OrderedDict()
+
+# Quoted literals in a Restrict filter ('...' values, "..." DASL property
+# names); the capturing group keeps them in re.split's output.
+_FILTER_LITERAL = re.compile(r"('[^']*'|\"[^\"]*\")")
+
+
+def _env_ttl(name: str, default: float) -> float:
+    """Read a cache lifetime in seconds from an environment variable
+
+    Args:
+        name: Environment variable to read
+        default: Lifetime to use when the variable is unset or invalid
+
+    Returns:
+        float: Configured lifetime in seconds, or default if the variable is
+            unset or not a non-negative number
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = -1.0
+    if not ttl >= 0:
+        logger.warning("Ignoring invalid %s=%r, using %s", name, value, default)
+        return default
+    return ttl
+
+
+def _search_ttl() -> float:
+    """Read the search cache lifetime from MAILTOOL_SEARCH_TTL
+
+    Returns:
+        float: Configured lifetime in seconds, or DEFAULT_SEARCH_TTL if the
+            variable is unset or not a non-negative number
+    """
+    return _env_ttl(SEARCH_TTL_ENV, DEFAULT_SEARCH_TTL)
+
+
+_SEARCH_TTL = _search_ttl()
+
+
+def _filter_key(filter_query: str) -> str:
+    """Normalize a Restrict filter for use as a search cache key
+
+    Runs of whitespace are collapsed to one space, except inside quoted
+    literals, where they are part of the value being matched.
+    """
+    parts = _FILTER_LITERAL.split(filter_query)
+    parts[::2] = [re.sub(r"\s+", " ", part) for part in parts[::2]]
+    return "".join(parts).strip()
+
+
+def _cached_search(
+    bridge: OutlookBridge, filter_query: str, limit: int, **options
+) -> list[EmailSummary]:
+    """Run bridge.search_emails through the short-lived search cache
+
+    Args:
+        bridge: The bridge to query on a cache miss
+        filter_query: Outlook Restrict filter
+        limit: Maximum number of emails to return
+        **options: Extra keyword arguments for bridge.search_emails
+
+    Returns:
+        list[EmailSummary]: A fresh list of the (possibly cached) summaries
+    """
+    key = (
+        _filter_key(filter_query),
+        limit,
+        options.get("include_non_mail", False),
+    )
+    now = time.monotonic()
+    entry = _search_cache.get(key)
+    if entry is not None and entry[1] is bridge and now < entry[0]:
+        _search_cache.move_to_end(key)
+        return list(entry[2])
+
+    result = bridge.search_emails(filter_query=filter_query, limit=limit, **options)
+    emails = _email_summaries(result)
+    if _SEARCH_TTL > 0:
+        _search_cache[key] = (now + _SEARCH_TTL, bridge, emails)
+        _search_cache.move_to_end(key)
+        if len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return list(emails)
+
+
+def _invalidate_searches() -> None:
+    """Drop cached search results after the inbox changed."""
+    _search_cache.clear()
+
+
+# Bounded cache of get_appointment / get_task results, so an agent that
+# re-fetches an item it just looked at skips the COM round-trip. Keys are the
+# model type and EntryID; entries remember the bridge they came from and are
+# dropped by the tools that change the item (_forget_item).
+# MAILTOOL_CACHE_TTL sets the lifetime in seconds; 0 disables the cache.
+CACHE_TTL_ENV = "MAILTOOL_CACHE_TTL"
+DEFAULT_CACHE_TTL = 30.0  # seconds
+_ITEM_CACHE_SIZE = 128
+_item_cache: OrderedDict[
+    tuple[type, str], tuple[float, OutlookBridge, AppointmentDetails | TaskSummary]
+] = OrderedDict()
+_CACHE_TTL = _env_ttl(CACHE_TTL_ENV, DEFAULT_CACHE_TTL)
+
+
+def _cached_item(model: type, entry_id: str, bridge: OutlookBridge):
+    """Return a cached model for an item, or None if absent or expired."""
+    key = (model, entry_id)
+    entry = _item_cache.get(key)
+    if entry is None:
+        return None
+    if entry[1] is not bridge or time.monotonic() >= entry[0]:
+        del _item_cache[key]
+        return None
+    _item_cache.move_to_end(key)
+    return entry[2]
+
+
+def _cache_item(entry_id: str, bridge: OutlookBridge, item) -> None:
+    """Remember a freshly built get_appointment / get_task result."""
+    if _CACHE_TTL <= 0:
+        return
+    key = (type(item), entry_id)
+    _item_cache[key] = (time.monotonic() + _CACHE_TTL, bridge, item)
+    _item_cache.move_to_end(key)
+    if len(_item_cache) > _ITEM_CACHE_SIZE:
+        _item_cache.popitem(last=False)
+
+
+def _forget_item(entry_id: str) -> None:
+    """Drop cached results for an item after it was changed or deleted."""
+    for key in [key for key in _item_cache if key[1] == entry_id]:
+        del _item_cache[key]
+    for key in [key for key, entry in _recent_creates.items() if entry[2] == entry_id]:
+        del _recent_creates[key]
+
+
+# Recently created appointments and tasks, keyed by the tool and the caller's
+# idempotency_key. An agent that retries a create with the same key after an
+# uncertain outcome gets the first item's EntryID back instead of a duplicate
+# item; calls without a key always create. Entries expire after
+# _CREATE_DEDUP_TTL seconds and are dropped once the item is changed or
+# deleted (_forget_item).
+_CREATE_DEDUP_TTL = 60.0  # seconds
+_CREATE_DEDUP_SIZE = 256
+_recent_creates: OrderedDict[tuple, tuple[float, OutlookBridge, str]] = OrderedDict()
+
+
+def _recent_create(key: tuple, bridge: OutlookBridge) -> str | None:
+    """Return the EntryID of a recent create with the same key, or None.
+
+    The EntryID is only returned while it still resolves, so an item removed
+    in Outlook itself is created again.
+    """
+    entry = _recent_creates.get(key)
+    if entry is None:
+        return None
+    if (
+        entry[1] is not bridge
+        or time.monotonic() >= entry[0]
+        or bridge.get_item_by_id(entry[2]) is None
+    ):
+        del _recent_creates[key]
+        return None
+    return entry[2]
+
+
+def _remember_create(key: tuple, bridge: OutlookBridge, entry_id: str) -> None:
+    """Record a successful create for _recent_create()."""
+    _recent_creates[key] = (time.monotonic() + _CREATE_DEDUP_TTL, bridge, entry_id)
+    _recent_creates.move_to_end(key)
+    if len(_recent_creates) > _CREATE_DEDUP_SIZE:
+        _recent_creates.popitem(last=False)
+
+
+# list_tasks(include_completed=True) and list_all_tasks return the same rows;
+# keep each variant briefly so back-to-back calls share one folder walk.
+# Rows are stored as a tuple of frozen TaskSummary models and every caller gets
+# its own list. Dropped by the tools that change tasks (_invalidate_task_lists).
+_TASK_LIST_TTL = 5.0  # seconds
+_task_list_cache: dict[bool, tuple[float, OutlookBridge, tuple[TaskSummary, ...]]] = {}
+
+
+def _cached_task_list(bridge: OutlookBridge, include_completed: bool):
+    """Run bridge.list_tasks through the short-lived task list cache
+
+    Args:
+        bridge: The bridge to query on a cache miss
+        include_completed: Whether completed tasks are included
+
+    Returns:
+        list[TaskSummary]: A fresh list of the (possibly cached) summaries
+    """
+    now = time.monotonic()
+    entry = _task_list_cache.get(include_completed)
+    if entry is not None and entry[1] is bridge and now < entry[0]:
+        return list(entry[2])
+
+    result = bridge.list_tasks(include_completed=include_completed)
+    tasks = _construct_list(TaskSummary, _TASK_SUMMARY_LIST, result, _TASK_KEYS)
+    _task_list_cache[include_completed] = (now + _TASK_LIST_TTL, bridge, tuple(tasks))
+    return tasks
+
+
+def _invalidate_task_lists() -> None:
+    """Drop cached task lists after a task was created or changed."""
+    _task_list_cache.clear()
+
+
+def _clear_caches() -> None:
+    """Drop every cached tool result; each entry holds a reference to its bridge."""
+    _search_cache.clear()
+    _item_cache.clear()
+    _task_list_cache.clear()
+    _recent_creates.clear()
 
 
 def _get_bridge():
@@ -75,70 +322,255 @@ def _get_bridge():
     Raises:
         OutlookComError: If bridge is not initialized (server not running)
     """
-    global _bridge
-
     # Ensure COM is initialized for the current thread before accessing bridge
+    # (a thread-local flag check after the first call on a thread)
     ensure_com_initialized()
 
-    if _bridge is None:
+    # Every tool call lands here, so the success path does no logging
+    bridge = _bridge
+    if bridge is None:
         logger.error("Outlook bridge not initialized. Is the server running?")
         raise OutlookComError("Outlook bridge not initialized. Is the server running?")
-    logger.debug("Retrieved Outlook bridge instance")
-    return _bridge
+    return bridge
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_timestamp(value: str, field: str) -> datetime:
+    """Parse a 'YYYY-MM-DD HH:MM:SS' tool argument into a naive datetime.
+
+    Bad input is rejected here instead of failing inside the COM call. Only
+    the exact TIMESTAMP_FORMAT is accepted: other ISO forms (a bare date,
+    fractional seconds, an offset) would reach Outlook as a different time
+    from the one meant. Agents tend to reuse the same round-hour timestamps,
+    so results are cached.
+
+    Raises:
+        OutlookValidationError: If value is not in 'YYYY-MM-DD HH:MM:SS' format
+    """
+    try:
+        return datetime.strptime(value, TIMESTAMP_FORMAT)
+    except ValueError:
+        raise OutlookValidationError(
+            f"Expected 'YYYY-MM-DD HH:MM:SS', got {value!r}", field=field
+        ) from None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_due_date(value: str) -> datetime:
+    """Parse a 'YYYY-MM-DD' due date into a datetime at noon.
+
+    Noon matches what the bridge uses for string due dates, avoiding
+    timezone boundary issues. As with _parse_timestamp, only the documented
+    format is accepted (not e.g. '20250125' or ISO week dates).
+
+    Raises:
+        OutlookValidationError: If value is not in 'YYYY-MM-DD' format
+    """
+    try:
+        day = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise OutlookValidationError(
+            f"Expected 'YYYY-MM-DD', got {value!r}", field="due_date"
+        ) from None
+    return day.replace(hour=12)
+
+
+# Set MAILTOOL_VALIDATE=1 to run full Pydantic validation on bridge results
+# (a debugging aid); by default the bridge's dicts are trusted apart from
+# coercing their bool/int/float fields (_coerce_scalars)
+VALIDATE_ENV = "MAILTOOL_VALIDATE"
+_VALIDATE = os.environ.get(VALIDATE_ENV) == "1"
+
+# Field names picked out of bridge dicts by _construct() and _construct_list()
+_ATTACHMENT_KEYS = tuple(AttachmentInfo.model_fields)
+_SUMMARY_KEYS = tuple(EmailSummary.model_fields)
+_EMAIL_KEYS = tuple(EmailDetails.model_fields)
+_APPT_SUMMARY_KEYS = tuple(AppointmentSummary.model_fields)
+_APPT_KEYS = tuple(AppointmentDetails.model_fields)
+_TASK_KEYS = tuple(TaskSummary.model_fields)
+
+# Whole-list validators used by _construct_list() under MAILTOOL_VALIDATE=1
+_EMAIL_SUMMARY_LIST = TypeAdapter(list[EmailSummary])
+_APPT_SUMMARY_LIST = TypeAdapter(list[AppointmentSummary])
+_TASK_SUMMARY_LIST = TypeAdapter(list[TaskSummary])
+
+# Values for required EmailSummary/EmailDetails fields the bridge may leave
+# out (e.g. the body fields when get_emails is called with include_body=False)
+_EMAIL_DEFAULTS = {
+    "entry_id": "",
+    "subject": "",
+    "sender": "",
+    "sender_name": "",
+    "body": "",
+    "html_body": "",
+    "unread": False,
+    "has_attachments": False,
+}
+
+
+@functools.cache
+def _scalar_fields(model) -> tuple[tuple[str, type, bool], ...]:
+    """List a model's bool/int/float fields as (name, type, optional)."""
+    scalars = []
+    for name, field in model.model_fields.items():
+        types = get_args(field.annotation) or (field.annotation,)
+        optional = type(None) in types
+        types = [t for t in types if t is not type(None)]
+        if len(types) == 1 and types[0] in (bool, int, float):
+            scalars.append((name, types[0], optional))
+    return tuple(scalars)
+
+
+def _coerce_scalars(model, fields: dict) -> dict:
+    """Coerce the bool/int/float fields of a bridge row to their model types.
+
+    model_construct() skips validation, so this keeps the few non-string
+    fields in line with the outputSchema clients are given (e.g. a COM
+    integer flag becomes a real bool).
+    """
+    for name, typ, optional in _scalar_fields(model):
+        if name not in fields:
+            continue
+        value = fields[name]
+        if value is None:
+            if not optional:
+                fields[name] = typ()
+        elif type(value) is not typ:
+            fields[name] = typ(value)
+    return fields
+
+
+def _construct(model, data: dict, keys: tuple[str, ...]):
+    """Build a model from the given keys of a bridge result dict.
+
+    The bridge already produces the models' field names, so full validation
+    is skipped unless MAILTOOL_VALIDATE=1 is set; only the bool/int/float
+    fields are coerced (_coerce_scalars). Keys missing from data fall back
+    to the model's field defaults.
+    """
+    fields = {k: data[k] for k in keys if k in data}
+    if _VALIDATE:
+        return model(**fields)
+    return model.model_construct(**_coerce_scalars(model, fields))
+
+
+def _construct_list(model, adapter: TypeAdapter, rows: list[dict], keys):
+    """Build a list of models from bridge result dicts.
+
+    Like _construct(), except that under MAILTOOL_VALIDATE=1 the whole list
+    is validated in one TypeAdapter call instead of model by model.
+    """
+    if _VALIDATE:
+        return adapter.validate_python(
+            [{k: row[k] for k in keys if k in row} for row in rows]
+        )
+    construct = model.model_construct
+    return [
+        construct(**_coerce_scalars(model, {k: row[k] for k in keys if k in row}))
+        for row in rows
+    ]
 
 
 def _email_summary_from_dict(email: dict) -> EmailSummary:
     """Build an EmailSummary from a bridge result dict (defaults for missing keys)."""
-    return EmailSummary(
-        entry_id=email.get("entry_id", ""),
-        subject=email.get("subject", ""),
-        sender=email.get("sender", ""),
-        sender_name=email.get("sender_name", ""),
-        received_time=email.get("received_time"),
-        unread=email.get("unread", False),
-        has_attachments=email.get("has_attachments", False),
-        message_class=email.get("message_class", "IPM.Note"),
-        to=email.get("to", ""),
-        cc=email.get("cc", ""),
-        sent_time=email.get("sent_time"),
-        conversation_id=email.get("conversation_id"),
-        conversation_topic=email.get("conversation_topic"),
+    return _construct(EmailSummary, {**_EMAIL_DEFAULTS, **email}, _SUMMARY_KEYS)
+
+
+def _email_summaries(emails: list[dict]) -> list[EmailSummary]:
+    """Build EmailSummary models from bridge result dicts (defaults for missing keys)."""
+    return _construct_list(
+        EmailSummary,
+        _EMAIL_SUMMARY_LIST,
+        [{**_EMAIL_DEFAULTS, **email} for email in emails],
+        _SUMMARY_KEYS,
     )
 
 
 def _email_details_from_dict(email: dict) -> EmailDetails:
     """Build an EmailDetails from a bridge result dict (defaults for missing keys)."""
     attachments = [
-        AttachmentInfo(
-            filename=a.get("filename", ""),
-            size=a.get("size", 0),
-            display_name=a.get("display_name", ""),
-            content_type=a.get("content_type"),
-            is_inline=a.get("is_inline", False),
-        )
+        _construct(AttachmentInfo, a, _ATTACHMENT_KEYS)
         for a in email.get("attachments", [])
     ]
-    return EmailDetails(
-        entry_id=email.get("entry_id", ""),
-        subject=email.get("subject", ""),
-        sender=email.get("sender", ""),
-        sender_name=email.get("sender_name", ""),
-        body=email.get("body", ""),
-        html_body=email.get("html_body", ""),
-        received_time=email.get("received_time"),
-        has_attachments=email.get("has_attachments", False),
-        message_class=email.get("message_class", "IPM.Note"),
-        to=email.get("to", ""),
-        cc=email.get("cc", ""),
-        bcc=email.get("bcc", ""),
-        sent_time=email.get("sent_time"),
-        conversation_id=email.get("conversation_id"),
-        conversation_topic=email.get("conversation_topic"),
-        attachments=attachments,
-        body_top=email.get("body_top", ""),
+    return _construct(
+        EmailDetails,
+        {**_EMAIL_DEFAULTS, **email, "attachments": attachments},
+        _EMAIL_KEYS,
     )
 
 
+# Shared results for the email tools whose outcome messages are fixed.
+# The result models are frozen, so one instance can be returned on every call.
+_MARK_READ_OK = OperationResult(success=True, message="Email marked as read")
+_MARK_READ_FAIL = OperationResult(success=False, message="Failed to mark email as read")
+_MARK_UNREAD_OK = OperationResult(success=True, message="Email marked as unread")
+_MARK_UNREAD_FAIL = OperationResult(
+    success=False, message="Failed to mark email as unread"
+)
+_DELETE_EMAIL_OK = OperationResult(success=True, message="Email deleted successfully")
+_DELETE_EMAIL_FAIL = OperationResult(success=False, message="Failed to delete email")
+_REPLY_OK = OperationResult(success=True, message="Email replied successfully")
+_REPLY_FAIL = OperationResult(success=False, message="Failed to reply")
+_REPLY_ALL_OK = OperationResult(
+    success=True, message="Email replied to all successfully"
+)
+_REPLY_ALL_FAIL = OperationResult(success=False, message="Failed to reply to all")
+_FORWARD_OK = OperationResult(success=True, message="Email forwarded successfully")
+_FORWARD_FAIL = OperationResult(success=False, message="Failed to forward email")
+_SEND_OK = SendEmailResult(
+    success=True, entry_id=None, message="Email sent successfully"
+)
+_SEND_FAIL = SendEmailResult(
+    success=False, entry_id=None, message="Failed to send email"
+)
+
+# Same for the calendar and task tools
+_DELETE_APPOINTMENT_OK = OperationResult(
+    success=True, message="Appointment deleted successfully"
+)
+_DELETE_APPOINTMENT_FAIL = OperationResult(
+    success=False, message="Failed to delete appointment"
+)
+_EDIT_APPOINTMENT_OK = OperationResult(
+    success=True, message="Appointment updated successfully"
+)
+_EDIT_APPOINTMENT_FAIL = OperationResult(
+    success=False, message="Failed to update appointment"
+)
+_CREATE_APPOINTMENT_FAIL = CreateAppointmentResult(
+    success=False, entry_id=None, message="Failed to create appointment"
+)
+_COMPLETE_TASK_OK = OperationResult(success=True, message="Task marked as complete")
+_COMPLETE_TASK_FAIL = OperationResult(
+    success=False, message="Failed to mark task as complete"
+)
+_DELETE_TASK_OK = OperationResult(success=True, message="Task deleted successfully")
+_DELETE_TASK_FAIL = OperationResult(success=False, message="Failed to delete task")
+_EDIT_TASK_OK = OperationResult(success=True, message="Task edited successfully")
+_EDIT_TASK_FAIL = OperationResult(success=False, message="Failed to edit task")
+_CREATE_TASK_FAIL = CreateTaskResult(
+    success=False, entry_id=None, message="Failed to create task"
+)
+
+# respond_to_meeting: accepted response -> (success result, failure result)
+_MEETING_RESPONSES = {
+    "accept": (
+        OperationResult(success=True, message="Meeting accepted successfully"),
+        OperationResult(success=False, message="Failed to accept meeting"),
+    ),
+    "decline": (
+        OperationResult(success=True, message="Meeting declined successfully"),
+        OperationResult(success=False, message="Failed to decline meeting"),
+    ),
+    "tentative": (
+        OperationResult(
+            success=True, message="Meeting tentatively accepted successfully"
+        ),
+        OperationResult(success=False, message="Failed to tentative meeting"),
+    ),
+}
+
+
 # ============================================================================
 # Email Tools (US-008: get_email, US-011: mark_email, US-013: delete_email, US-016: list_emails, US-017: send_email, US-018: reply_email, US-019: forward_email, US-020: move_email, US-021: search_emails)
 # ============================================================================
@@ -174,7 +606,7 @@ def list_emails(
     result = bridge.list_emails(
         limit=limit, folder=folder, include_non_mail=include_non_mail
     )
-    return [_email_summary_from_dict(email) for email in result]
+    return _email_summaries(result)
 
 
 @mcp.tool()
@@ -203,8 +635,8 @@ def list_unread_emails(limit: int = 10) -> list[EmailSummary]:
         for efficient querying at the COM level, avoiding unnecessary iteration.
     """
     bridge = _get_bridge()
-    result = bridge.search_emails(filter_query="[Unread] = TRUE", limit=limit)
-    return [_email_summary_from_dict(email) for email in result]
+    # Repeated polls within _SEARCH_TTL reuse the last result for this limit
+    return _cached_search(bridge, "[Unread] = TRUE", limit)
 
 
 @mcp.tool()
@@ -234,9 +666,9 @@ def get_email(entry_id: str) -> EmailDetails:
     bridge = _get_bridge()
     result = bridge.get_email_body(entry_id)
     if result is None:
-        logger.error(f"Email not found: {entry_id}")
+        logger.error("Email not found: %s", entry_id)
         raise OutlookNotFoundError("Email not found", entry_id=entry_id)
-    logger.debug(f"Retrieved email: {entry_id}")
+    logger.debug("Retrieved email: %s", entry_id)
     return _email_details_from_dict(result)
 
 
@@ -286,18 +718,13 @@ def mark_email(entry_id: str, unread: bool = False) -> OperationResult:
 
     # Mark email as read/unread via bridge
     result = bridge.mark_email_read(entry_id, unread=unread)
+    _invalidate_resources("inbox://")
+    _invalidate_searches()
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message=f"Email marked as {'unread' if unread else 'read'}",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message=f"Failed to mark email as {'unread' if unread else 'read'}",
-        )
+    if unread:
+        return _MARK_UNREAD_OK if result else _MARK_UNREAD_FAIL
+    return _MARK_READ_OK if result else _MARK_READ_FAIL
 
 
 @mcp.tool()
@@ -321,18 +748,11 @@ def delete_email(entry_id: str) -> OperationResult:
 
     # Delete email via bridge
     result = bridge.delete_email(entry_id)
+    _invalidate_resources("inbox://")
+    _invalidate_searches()
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Email deleted successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to delete email",
-        )
+    return _DELETE_EMAIL_OK if result else _DELETE_EMAIL_FAIL
 
 
 @mcp.tool()
@@ -386,23 +806,17 @@ def send_email(
     # Convert bridge result to SendEmailResult
     # Bridge returns: False (failed), True (sent), str (draft EntryID)
     if result is False:
-        return SendEmailResult(
-            success=False,
-            entry_id=None,
-            message="Failed to send email",
-        )
-    elif result is True:
-        return SendEmailResult(
-            success=True,
-            entry_id=None,
-            message="Email sent successfully",
-        )
-    else:  # str - draft EntryID
-        return SendEmailResult(
-            success=True,
-            entry_id=result,
-            message=f"Email saved as draft: {result}",
-        )
+        return _SEND_FAIL
+    if result is True:
+        # A sent message can land in our own inbox (e.g. sent to self)
+        _invalidate_searches()
+        return _SEND_OK
+    # str - draft EntryID, so this result is built per call
+    return SendEmailResult.model_construct(
+        success=True,
+        entry_id=result,
+        message=f"Email saved as draft: {result}",
+    )
 
 
 @mcp.tool()
@@ -431,16 +845,9 @@ def reply_email(entry_id: str, body: str, reply_all: bool = False) -> OperationR
     result = bridge.reply_email(entry_id, body=body, reply_all=reply_all)
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message=f"Email {'replied to all' if reply_all else 'replied'} successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message=f"Failed to {'reply to all' if reply_all else 'reply'}",
-        )
+    if reply_all:
+        return _REPLY_ALL_OK if result else _REPLY_ALL_FAIL
+    return _REPLY_OK if result else _REPLY_FAIL
 
 
 @mcp.tool()
@@ -469,16 +876,7 @@ def forward_email(entry_id: str, to: str, body: str = "") -> OperationResult:
     result = bridge.forward_email(entry_id, to=to, body=body)
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Email forwarded successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to forward email",
-        )
+    return _FORWARD_OK if result else _FORWARD_FAIL
 
 
 @mcp.tool()
@@ -503,15 +901,18 @@ def move_email(entry_id: str, folder: str) -> OperationResult:
 
     # Move email via bridge
     result = bridge.move_email(entry_id, folder_name=folder)
+    _invalidate_resources("inbox://")
+    _invalidate_searches()
 
     # Convert boolean result to OperationResult
+    # The message names the folder, so this result is built per call
     if result:
-        return OperationResult(
+        return OperationResult.model_construct(
             success=True,
             message=f"Email moved to {folder}",
         )
     else:
-        return OperationResult(
+        return OperationResult.model_construct(
             success=False,
             message=f"Failed to move email to {folder}",
         )
@@ -554,10 +955,9 @@ def search_emails(
         search_emails("[HasAttachments] = TRUE")  # Only emails with attachments
     """
     bridge = _get_bridge()
-    result = bridge.search_emails(
-        filter_query=filter_query, limit=limit, include_non_mail=include_non_mail
+    return _cached_search(
+        bridge, filter_query, limit, include_non_mail=include_non_mail
     )
-    return [_email_summary_from_dict(email) for email in result]
 
 
 @mcp.tool()
@@ -601,7 +1001,7 @@ def search_emails_by_sender(
         folder=folder,
         include_non_mail=include_non_mail,
     )
-    return [_email_summary_from_dict(email) for email in result]
+    return _email_summaries(result)
 
 
 @mcp.tool()
@@ -649,7 +1049,8 @@ def list_calendar_events(
 
     Args:
         days: Number of days ahead to look (default: 7)
-        all_events: If True, return all events without date filtering (default: False)
+        all_events: If True, return all events without date filtering, listing
+            each recurring series once (default: False)
 
     Returns:
         list[AppointmentSummary]: List of appointment summaries with basic information
@@ -668,23 +1069,9 @@ def list_calendar_events(
     result = bridge.list_calendar_events(days=days, all_events=all_events)
 
     # Convert bridge result to list of AppointmentSummary models
-    return [
-        AppointmentSummary(
-            entry_id=event["entry_id"],
-            subject=event["subject"],
-            start=event["start"],
-            end=event["end"],
-            location=event["location"],
-            organizer=event["organizer"],
-            all_day=event["all_day"],
-            required_attendees=event["required_attendees"],
-            optional_attendees=event["optional_attendees"],
-            response_status=event["response_status"],
-            meeting_status=event["meeting_status"],
-            response_requested=event["response_requested"],
-        )
-        for event in result
-    ]
+    return _construct_list(
+        AppointmentSummary, _APPT_SUMMARY_LIST, result, _APPT_SUMMARY_KEYS
+    )
 
 
 @mcp.tool()
@@ -708,33 +1095,25 @@ def get_appointment(entry_id: str) -> AppointmentDetails:
     # Get bridge from module-level state
     bridge = _get_bridge()
 
+    cached = _cached_item(AppointmentDetails, entry_id, bridge)
+    if cached is not None:
+        return cached
+
     # Get appointment details from bridge
     result = bridge.get_appointment(entry_id)
 
     # Check if appointment was found
     if result is None:
-        logger.error(f"Appointment not found: {entry_id}")
+        logger.error("Appointment not found: %s", entry_id)
         raise OutlookNotFoundError("Appointment not found", entry_id=entry_id)
 
-    logger.debug(f"Retrieved appointment: {entry_id}")
+    logger.debug("Retrieved appointment: %s", entry_id)
 
     # Convert bridge result to AppointmentDetails model
     # Note: AppointmentDetails extends AppointmentSummary, adding 'body' field
-    return AppointmentDetails(
-        entry_id=result["entry_id"],
-        subject=result["subject"],
-        start=result["start"],
-        end=result["end"],
-        location=result["location"],
-        organizer=result["organizer"],
-        body=result["body"],
-        all_day=result["all_day"],
-        required_attendees=result["required_attendees"],
-        optional_attendees=result["optional_attendees"],
-        response_status=result["response_status"],
-        meeting_status=result["meeting_status"],
-        response_requested=result["response_requested"],
-    )
+    appointment = _construct(AppointmentDetails, result, _APPT_KEYS)
+    _cache_item(entry_id, bridge, appointment)
+    return appointment
 
 
 @mcp.tool()
@@ -758,18 +1137,11 @@ def delete_appointment(entry_id: str) -> OperationResult:
 
     # Delete appointment via bridge
     result = bridge.delete_appointment(entry_id)
+    _forget_item(entry_id)
+    _invalidate_resources("calendar://")
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Appointment deleted successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to delete appointment",
-        )
+    return _DELETE_APPOINTMENT_OK if result else _DELETE_APPOINTMENT_FAIL
 
 
 @mcp.tool()
@@ -782,6 +1154,7 @@ def create_appointment(
     all_day: bool = False,
     required_attendees: str | None = None,
     optional_attendees: str | None = None,
+    idempotency_key: str | None = None,
 ) -> CreateAppointmentResult:
     """
     Create a calendar appointment.
@@ -798,42 +1171,56 @@ def create_appointment(
         all_day: True for all-day event, False for timed event (default: False)
         required_attendees: Semicolon-separated list of required attendees (optional)
         optional_attendees: Semicolon-separated list of optional attendees (optional)
+        idempotency_key: Caller-chosen key for retries (optional). A repeat call
+            with the same key within 60 seconds returns the appointment already
+            created instead of creating another one.
 
     Returns:
         CreateAppointmentResult: Result with success status, appointment entry ID (if created), and message
 
     Raises:
         OutlookComError: If bridge is not initialized
+        OutlookValidationError: If start or end is not a valid timestamp
     """
     # Get bridge from module-level state
     bridge = _get_bridge()
+    start_dt = _parse_timestamp(start, "start")
+    end_dt = _parse_timestamp(end, "end")
+
+    # A retry with the same idempotency key returns the appointment already created
+    key = ("appointment", idempotency_key)
+    existing = _recent_create(key, bridge) if idempotency_key else None
+    if existing is not None:
+        return CreateAppointmentResult(
+            success=True,
+            entry_id=existing,
+            message=f"Appointment already created: {existing} (repeated idempotency_key)",
+        )
 
     # Create appointment via bridge
     result = bridge.create_appointment(
         subject=subject,
-        start=start,
-        end=end,
+        start=start_dt,
+        end=end_dt,
         location=location,
         body=body,
         all_day=all_day,
         required_attendees=required_attendees,
         optional_attendees=optional_attendees,
     )
+    _invalidate_resources("calendar://")
 
     # Convert bridge result to CreateAppointmentResult
     # Bridge returns: str (EntryID) if successful, None if failed
     if result:
+        if idempotency_key:
+            _remember_create(key, bridge, result)
         return CreateAppointmentResult(
             success=True,
             entry_id=result,
             message=f"Appointment created successfully: {result}",
         )
-    else:
-        return CreateAppointmentResult(
-            success=False,
-            entry_id=None,
-            message="Failed to create appointment",
-        )
+    return _CREATE_APPOINTMENT_FAIL
 
 
 @mcp.tool()
@@ -868,6 +1255,7 @@ def edit_appointment(
 
     Raises:
         OutlookComError: If bridge is not initialized
+        OutlookValidationError: If start or end is not a valid timestamp
     """
     # Get bridge from module-level state
     bridge = _get_bridge()
@@ -878,23 +1266,16 @@ def edit_appointment(
         required_attendees=required_attendees,
         optional_attendees=optional_attendees,
         subject=subject,
-        start=start,
-        end=end,
+        start=_parse_timestamp(start, "start") if start else start,
+        end=_parse_timestamp(end, "end") if end else end,
         location=location,
         body=body,
     )
+    _forget_item(entry_id)
+    _invalidate_resources("calendar://")
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Appointment updated successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to update appointment",
-        )
+    return _EDIT_APPOINTMENT_OK if result else _EDIT_APPOINTMENT_FAIL
 
 
 @mcp.tool()
@@ -914,24 +1295,26 @@ def respond_to_meeting(entry_id: str, response: str) -> OperationResult:
 
     Raises:
         OutlookComError: If bridge is not initialized
+        OutlookValidationError: If response is not a supported response type
     """
     # Get bridge from module-level state
     bridge = _get_bridge()
 
+    # Unknown responses never reach Outlook
+    response = response.lower()
+    results = _MEETING_RESPONSES.get(response)
+    if results is None:
+        raise OutlookValidationError(
+            "Expected 'accept', 'decline' or 'tentative'", field="response"
+        )
+
     # Respond to meeting via bridge
     result = bridge.respond_to_meeting(entry_id, response)
+    _forget_item(entry_id)
+    _invalidate_resources("calendar://")
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message=f"Meeting {response.lower()}ed successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message=f"Failed to {response.lower()} meeting",
-        )
+    return results[0] if result else results[1]
 
 
 @mcp.tool()
@@ -1007,23 +1390,8 @@ def list_tasks(include_completed: bool = False) -> list[TaskSummary]:
     # Get bridge from module-level state
     bridge = _get_bridge()
 
-    # List tasks via bridge
-    result = bridge.list_tasks(include_completed=include_completed)
-
-    # Convert bridge result to list of TaskSummary models
-    return [
-        TaskSummary(
-            entry_id=task["entry_id"],
-            subject=task["subject"],
-            body=task["body"],
-            due_date=task["due_date"],
-            status=task["status"],
-            priority=task["priority"],
-            complete=task["complete"],
-            percent_complete=task["percent_complete"],
-        )
-        for task in result
-    ]
+    # List tasks via bridge (shared with list_all_tasks for a few seconds)
+    return _cached_task_list(bridge, include_completed)
 
 
 @mcp.tool()
@@ -1045,22 +1413,7 @@ def list_all_tasks() -> list[TaskSummary]:
     bridge = _get_bridge()
 
     # List all tasks via bridge (hardcoded include_completed=True)
-    result = bridge.list_tasks(include_completed=True)
-
-    # Convert bridge result to list of TaskSummary models
-    return [
-        TaskSummary(
-            entry_id=task["entry_id"],
-            subject=task["subject"],
-            body=task["body"],
-            due_date=task["due_date"],
-            status=task["status"],
-            priority=task["priority"],
-            complete=task["complete"],
-            percent_complete=task["percent_complete"],
-        )
-        for task in result
-    ]
+    return _cached_task_list(bridge, True)
 
 
 @mcp.tool()
@@ -1084,28 +1437,25 @@ def get_task(entry_id: str) -> TaskSummary:
     # Get bridge from module-level state
     bridge = _get_bridge()
 
+    cached = _cached_item(TaskSummary, entry_id, bridge)
+    if cached is not None:
+        return cached
+
     # Get task details from bridge
     result = bridge.get_task(entry_id)
 
     # Check if task was found
     if result is None:
-        logger.error(f"Task not found: {entry_id}")
+        logger.error("Task not found: %s", entry_id)
         raise OutlookNotFoundError("Task not found", entry_id=entry_id)
 
-    logger.debug(f"Retrieved task: {entry_id}")
+    logger.debug("Retrieved task: %s", entry_id)
 
     # Convert bridge result to TaskSummary model
     # Note: TaskSummary includes all fields from bridge.get_task()
-    return TaskSummary(
-        entry_id=result["entry_id"],
-        subject=result["subject"],
-        body=result["body"],
-        due_date=result["due_date"],
-        status=result["status"],
-        priority=result["priority"],
-        complete=result["complete"],
-        percent_complete=result["percent_complete"],
-    )
+    task = _construct(TaskSummary, result, _TASK_KEYS)
+    _cache_item(entry_id, bridge, task)
+    return task
 
 
 @mcp.tool()
@@ -1130,18 +1480,12 @@ def complete_task(entry_id: str) -> OperationResult:
 
     # Mark task as complete via bridge
     result = bridge.complete_task(entry_id)
+    _forget_item(entry_id)
+    _invalidate_task_lists()
+    _invalidate_resources("tasks://")
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Task marked as complete",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to mark task as complete",
-        )
+    return _COMPLETE_TASK_OK if result else _COMPLETE_TASK_FAIL
 
 
 @mcp.tool()
@@ -1165,18 +1509,12 @@ def delete_task(entry_id: str) -> OperationResult:
 
     # Delete task via bridge
     result = bridge.delete_task(entry_id)
+    _forget_item(entry_id)
+    _invalidate_task_lists()
+    _invalidate_resources("tasks://")
 
     # Convert boolean result to OperationResult
-    if result:
-        return OperationResult(
-            success=True,
-            message="Task deleted successfully",
-        )
-    else:
-        return OperationResult(
-            success=False,
-            message="Failed to delete task",
-        )
+    return _DELETE_TASK_OK if result else _DELETE_TASK_FAIL
 
 
 @mcp.tool()
@@ -1185,6 +1523,7 @@ def create_task(
     body: str = "",
     due_date: str | None = None,
     priority: int = 1,
+    idempotency_key: str | None = None,
 ) -> CreateTaskResult:
     """
     Create a new task.
@@ -1197,39 +1536,53 @@ def create_task(
         body: Task description or body text (default: "")
         due_date: Due date in 'YYYY-MM-DD' format (optional)
         priority: Task priority - 0=Low, 1=Normal (default), 2=High
+        idempotency_key: Caller-chosen key for retries (optional). A repeat call
+            with the same key within 60 seconds returns the task already created
+            instead of creating another one.
 
     Returns:
         CreateTaskResult: Result with success status, task entry ID (if created), and message
 
     Raises:
         OutlookComError: If bridge is not initialized
+        OutlookValidationError: If due_date is not a valid date
     """
     # Get bridge from module-level state
     bridge = _get_bridge()
+    due = _parse_due_date(due_date) if due_date else due_date
+
+    # A retry with the same idempotency key returns the task already created
+    key = ("task", idempotency_key)
+    existing = _recent_create(key, bridge) if idempotency_key else None
+    if existing is not None:
+        return CreateTaskResult(
+            success=True,
+            entry_id=existing,
+            message=f"Task already created: {existing} (repeated idempotency_key)",
+        )
 
     # Create task via bridge
     # Note: bridge parameter is 'importance', not 'priority'
     result = bridge.create_task(
         subject=subject,
         body=body,
-        due_date=due_date,
+        due_date=due,
         importance=priority,
     )
+    _invalidate_task_lists()
+    _invalidate_resources("tasks://")
 
     # Convert bridge result to CreateTaskResult
     # Bridge returns: str (EntryID) if successful, None if failed
     if result:
+        if idempotency_key:
+            _remember_create(key, bridge, result)
         return CreateTaskResult(
             success=True,
             entry_id=result,
             message=f"Task created successfully: {result}",
         )
-    else:
-        return CreateTaskResult(
-            success=False,
-            entry_id=None,
-            message="Failed to create task",
-        )
+    return _CREATE_TASK_FAIL
 
 
 @mcp.tool()
@@ -1263,6 +1616,7 @@ def edit_task(
 
     Raises:
         OutlookComError: If bridge is not initialized
+        OutlookValidationError: If due_date is not a valid date
     """
     # Get bridge from module-level state
     bridge = _get_bridge()
@@ -1273,18 +1627,18 @@ def edit_task(
         entry_id=entry_id,
         subject=subject,
         body=body,
-        due_date=due_date,
+        due_date=_parse_due_date(due_date) if due_date else due_date,
         importance=priority,
         percent_complete=percent_complete,
         complete=complete,
     )
+    _forget_item(entry_id)
+    _invalidate_task_lists()
+    _invalidate_resources("tasks://")
 
     # Convert bridge result to OperationResult
     # Bridge returns: True if successful, False if failed
-    if result:
-        return OperationResult(success=True, message="Task edited successfully")
-    else:
-        return OperationResult(success=False, message="Failed to edit task")
+    return _EDIT_TASK_OK if result else _EDIT_TASK_FAIL
 
 
 def main(default_account: str | None = None):
@@ -0,0 +1,84 @@
+"""Tests for per-thread COM initialization tracking.
+
+These tests run ensure_com_initialized() on fresh worker threads with
+CoInitialize patched out, so they do not need a live COM runtime.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from mailtool.mcp import com_state
+
+
+def _run_in_thread(func) -> None:
+    """Run func on a new thread and wait for it to finish."""
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join()
+
+
+@pytest.fixture
+def co_initialize(monkeypatch):
+    """Replace the bound pythoncom.CoInitialize with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr(com_state, "_CO_INITIALIZE", mock)
+    return mock
+
+
+class TestEnsureComInitialized:
+    """Tests for ensure_com_initialized()."""
+
+    def test_initializes_once_per_thread(self, co_initialize) -> None:
+        """Test that repeated calls on one thread call CoInitialize once."""
+
+        def worker() -> None:
+            for _ in range(5):
+                com_state.ensure_com_initialized()
+
+        _run_in_thread(worker)
+        assert co_initialize.call_count == 1
+
+    def test_initializes_each_thread(self, co_initialize) -> None:
+        """Test that every new thread initializes COM for itself."""
+        _run_in_thread(com_state.ensure_com_initialized)
+        _run_in_thread(com_state.ensure_com_initialized)
+        assert co_initialize.call_count == 2
+
+    def test_thread_is_tracked(self, co_initialize) -> None:
+        """Test that an initialized thread is reported by the helpers."""
+        seen: dict[str, object] = {}
+
+        def worker() -> None:
+            com_state.ensure_com_initialized()
+            seen["initialized"] = com_state.is_com_initialized_for_thread()
+            seen["count"] = com_state.get_initialized_thread_count()
+
+        _run_in_thread(worker)
+
+        assert seen["initialized"] is True
+        assert seen["count"] >= 1
+
+
+class TestReleaseComForThread:
+    """Tests for release_com_for_thread()."""
+
+    def test_release_balances_init(self, co_initialize, monkeypatch) -> None:
+        """Test that release uninitializes once and the thread can re-init."""
+        co_uninitialize = MagicMock()
+        monkeypatch.setattr(com_state, "_CO_UNINITIALIZE", co_uninitialize)
+        seen: dict[str, object] = {}
+
+        def worker() -> None:
+            com_state.ensure_com_initialized()
+            com_state.release_com_for_thread()
+            com_state.release_com_for_thread()
+            seen["initialized"] = com_state.is_com_initialized_for_thread()
+            com_state.ensure_com_initialized()
+
+        _run_in_thread(worker)
+
+        assert co_uninitialize.call_count == 1
+        assert seen["initialized"] is False
+        assert co_initialize.call_count == 2
@@ -199,3 +199,16 @@ class TestExceptionAttributes:
         message3 = str(error3)
         assert "priority" in message3
         assert "Invalid priority value" in message3
+
+    def test_error_data_is_filled_per_raise(self) -> None:
+        """Test that each exception gets its own code, message and data."""
+        first = OutlookNotFoundError("Email not found", entry_id="ABC")
+        second = OutlookNotFoundError("Task not found")
+
+        assert first.error.code == -32602
+        assert first.error.data == {"entry_id": "ABC"}
+        assert second.error.message == "Task not found"
+        assert second.error.data is None
+
+        assert OutlookComError("COM error", details="x").error.code == -32603
+        assert OutlookValidationError("Invalid", field="f").error.data == {"field": "f"}
@@ -0,0 +1,43 @@
+"""Tests for lifespan helper functions.
+
+These cover the pure-Python configuration helpers used by outlook_lifespan;
+the lifespan itself needs a running Outlook and is exercised by the
+integration tests.
+"""
+
+import pytest
+
+from mailtool.mcp import lifespan
+
+
+class TestThreadPoolSize:
+    """Tests for _thread_pool_size()."""
+
+    def test_default_when_unset(self, monkeypatch) -> None:
+        """Test that the default is used when the variable is unset."""
+        monkeypatch.delenv(lifespan.THREAD_POOL_SIZE_ENV, raising=False)
+        assert lifespan._thread_pool_size() == lifespan.DEFAULT_THREAD_POOL_SIZE
+
+    def test_reads_env_value(self, monkeypatch) -> None:
+        """Test that a positive integer is taken from the environment."""
+        monkeypatch.setenv(lifespan.THREAD_POOL_SIZE_ENV, "4")
+        assert lifespan._thread_pool_size() == 4
+
+    @pytest.mark.parametrize("value", ["0", "-1", "many"])
+    def test_invalid_value_falls_back(self, monkeypatch, value) -> None:
+        """Test that invalid values fall back to the default."""
+        monkeypatch.setenv(lifespan.THREAD_POOL_SIZE_ENV, value)
+        assert lifespan._thread_pool_size() == lifespan.DEFAULT_THREAD_POOL_SIZE
+
+
+class TestRetryDelay:
+    """Tests for _retry_delay()."""
+
+    @pytest.mark.parametrize(
+        ("attempt", "expected"), [(1, 0.1), (2, 0.2), (3, 0.4), (5, 1.6), (8, 1.6)]
+    )
+    def test_delay_within_jitter_bounds(self, attempt, expected) -> None:
+        """Test that delays double per attempt, cap out, and stay within jitter."""
+        for _ in range(20):
+            delay = lifespan._retry_delay(attempt)
+            assert expected * 0.8 <= delay < expected * 1.2
@@ -68,6 +68,23 @@ class TestEmailSummary:
         with pytest.raises(ValidationError):
             EmailSummary(**data)
 
+    def test_email_summary_frozen_and_strict_extras(self):
+        """Test EmailSummary rejects unknown fields and attribute assignment"""
+        data = {
+            "entry_id": "test-entry-id-123",
+            "subject": "Test Subject",
+            "sender": "sender@example.com",
+            "sender_name": "Test Sender",
+            "unread": True,
+            "has_attachments": False,
+        }
+        with pytest.raises(ValidationError):
+            EmailSummary(**data, recieved_time="2025-01-19 10:30:00")
+
+        email = EmailSummary(**data)
+        with pytest.raises(ValidationError):
+            email.unread = False
+
 
 class TestEmailDetails:
     """Test EmailDetails model validation"""
@@ -686,6 +703,39 @@ class TestOperationResult:
         with pytest.raises(ValidationError):
             OperationResult(**data)
 
+    def test_operation_result_frozen(self):
+        """Test OperationResult rejects assignment and unknown fields"""
+        result = OperationResult(success=True, message="Done")
+        with pytest.raises(ValidationError):
+            result.success = False
+        with pytest.raises(ValidationError):
+            OperationResult(success=True, message="Done", sucess=False)
+
+    @pytest.mark.parametrize("model", [CreateAppointmentResult, CreateTaskResult])
+    def test_create_results_frozen(self, model):
+        """Test create results reject assignment and unknown fields"""
+        result = model(success=False, entry_id=None, message="Failed")
+        with pytest.raises(ValidationError):
+            result.entry_id = "new-id"
+        with pytest.raises(ValidationError):
+            model(success=True, entry_id="new-id", message="Done", entryid="x")
+
+    @pytest.mark.parametrize(
+        ("model", "field"),
+        [(AppointmentSummary, "subject"), (AppointmentDetails, "body")],
+    )
+    def test_appointment_models_frozen(self, model, field):
+        """Test appointment models reject attribute assignment (cached instances)"""
+        appointment = model.model_construct(entry_id="apt-1", subject="Sync")
+        with pytest.raises(ValidationError):
+            setattr(appointment, field, "changed")
+
+    def test_task_summary_frozen(self):
+        """Test TaskSummary rejects attribute assignment (cached instances)"""
+        task = TaskSummary.model_construct(entry_id="task-1", complete=False)
+        with pytest.raises(ValidationError):
+            task.complete = True
+
 
 class TestTaskModelSerialization:
     """Test task model serialization and deserialization"""
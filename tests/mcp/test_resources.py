@@ -133,18 +133,16 @@ class TestHelperFunctions:
     """Test resource helper formatting functions"""
 
     def test_format_email_summary(self):
-        """Test email summary formatting"""
-        from mailtool.mcp.models import EmailSummary
-
-        email = EmailSummary(
-            entry_id="email-123",
-            subject="Test Subject",
-            sender="test@example.com",
-            sender_name="Test Sender",
-            received_time="2025-01-19 10:00:00",
-            unread=True,
-            has_attachments=False,
-        )
+        """Test email summary formatting from a bridge dict"""
+        email = {
+            "entry_id": "email-123",
+            "subject": "Test Subject",
+            "sender": "test@example.com",
+            "sender_name": "Test Sender",
+            "received_time": "2025-01-19 10:00:00",
+            "unread": True,
+            "has_attachments": False,
+        }
 
         result = resources._format_email_summary(email)
 
@@ -179,22 +177,20 @@ class TestHelperFunctions:
 
     def test_format_appointment_summary(self):
         """Test appointment summary formatting"""
-        from mailtool.mcp.models import AppointmentSummary
-
-        appt = AppointmentSummary(
-            entry_id="apt-123",
-            subject="Test Meeting",
-            start="2025-01-19 14:00:00",
-            end="2025-01-19 15:00:00",
-            location="Room 101",
-            organizer="organizer@example.com",
-            all_day=False,
-            required_attendees="attendee@example.com",
-            optional_attendees="",
-            response_status="Accepted",
-            meeting_status="Meeting",
-            response_requested=True,
-        )
+        appt = {
+            "entry_id": "apt-123",
+            "subject": "Test Meeting",
+            "start": "2025-01-19 14:00:00",
+            "end": "2025-01-19 15:00:00",
+            "location": "Room 101",
+            "organizer": "organizer@example.com",
+            "all_day": False,
+            "required_attendees": "attendee@example.com",
+            "optional_attendees": "",
+            "response_status": "Accepted",
+            "meeting_status": "Meeting",
+            "response_requested": True,
+        }
 
         result = resources._format_appointment_summary(appt)
 
@@ -206,18 +202,16 @@ class TestHelperFunctions:
 
     def test_format_task_summary(self):
         """Test task summary formatting"""
-        from mailtool.mcp.models import TaskSummary
-
-        task = TaskSummary(
-            entry_id="task-123",
-            subject="Test Task",
-            body="Task description",
-            due_date="2025-01-20",
-            status=1,  # In Progress
-            priority=2,  # High
-            complete=False,
-            percent_complete=50.0,
-        )
+        task = {
+            "entry_id": "task-123",
+            "subject": "Test Task",
+            "body": "Task description",
+            "due_date": "2025-01-20",
+            "status": 1,  # In Progress
+            "priority": 2,  # High
+            "complete": False,
+            "percent_complete": 50.0,
+        }
 
         result = resources._format_task_summary(task)
 
@@ -228,6 +222,13 @@ class TestHelperFunctions:
         assert "50.0%" in result
         assert "No" in result  # not complete
 
+    def test_task_code_names(self):
+        """Test task status/priority code lookup edge cases"""
+        assert resources._code_name(resources._TASK_STATUS_NAMES, 5) == "Other"
+        assert resources._code_name(resources._TASK_STATUS_NAMES, 6) == "Unknown"
+        assert resources._code_name(resources._TASK_PRIORITY_NAMES, -1) == "Unknown"
+        assert resources._code_name(resources._TASK_PRIORITY_NAMES, None) == "N/A"
+
 
 # =============================================================================
 # Email Resource Tests
@@ -254,6 +255,75 @@ class TestEmailResources:
         assert result[0]["entry_id"] == "email-123"
         assert result[1]["entry_id"] == "email-456"
 
+    async def test_inbox_emails_renders_bridge_dicts(self, set_bridge, mock_bridge):
+        """Test inbox://emails formats the bridge dicts without a model step"""
+        from mcp.server import FastMCP
+
+        mcp = FastMCP("test-server")
+        resources.register_email_resources(mcp)
+
+        contents = await mcp.read_resource("inbox://emails")
+        text = contents[0].content
+
+        assert text.startswith("Inbox Emails (2 items)")
+        assert "Subject: Test Email" in text
+        assert "From: Read Sender <read@example.com>" in text
+        assert "MessageClass: IPM.Note" in text
+
+    async def test_inbox_unread_filters_in_bridge(self, set_bridge, mock_bridge):
+        """Test inbox://unread asks the bridge for unread items only"""
+        from mcp.server import FastMCP
+
+        mock_bridge.list_emails.return_value = mock_bridge.list_emails.return_value[:1]
+        mcp = FastMCP("test-server")
+        resources.register_email_resources(mcp)
+
+        contents = await mcp.read_resource("inbox://unread")
+
+        mock_bridge.list_emails.assert_called_once_with(
+            limit=50, folder="Inbox", unread_only=True
+        )
+        assert contents[0].content.startswith("Unread Emails (1 items)")
+
+    async def test_inbox_text_cached_until_invalidated(self, set_bridge, mock_bridge):
+        """Test repeated inbox reads reuse the rendered text until invalidated"""
+        from mcp.server import FastMCP
+
+        mcp = FastMCP("test-server")
+        resources.register_email_resources(mcp)
+
+        first = await mcp.read_resource("inbox://emails")
+        second = await mcp.read_resource("inbox://emails")
+
+        assert second[0].content == first[0].content
+        mock_bridge.list_emails.assert_called_once()
+
+        resources._invalidate_resources("calendar://")
+        await mcp.read_resource("inbox://emails")
+        mock_bridge.list_emails.assert_called_once()
+
+        resources._invalidate_resources("inbox://")
+        await mcp.read_resource("inbox://emails")
+        assert mock_bridge.list_emails.call_count == 2
+
+    async def test_inbox_text_not_shared_across_bridges(self, set_bridge, mock_bridge):
+        """Test cached text is only reused for the bridge that rendered it"""
+        from mcp.server import FastMCP
+
+        mcp = FastMCP("test-server")
+        resources.register_email_resources(mcp)
+        await mcp.read_resource("inbox://emails")
+
+        other = MagicMock()
+        other.list_emails.return_value = []
+        resources._bridge_var.set(other)
+        contents = await mcp.read_resource("inbox://emails")
+        assert contents[0].content == "No emails found in inbox"
+
+        resources._bridge_var.set(None)
+        with pytest.raises(Exception, match="Outlook bridge not initialized"):
+            await mcp.read_resource("inbox://emails")
+
     def test_inbox_unread_resource(self, set_bridge, mock_bridge):
         """Test inbox://unread resource"""
         # Register resources with mock MCP server
@@ -402,6 +472,19 @@ class TestTaskResources:
         mock_bridge.list_tasks(include_completed=False)
         mock_bridge.list_tasks.assert_called_with(include_completed=False)
 
+    async def test_tasks_all_renders_items_and_rules(self, set_bridge, mock_bridge):
+        """Test tasks://all lays out header, items and separators"""
+        from mcp.server import FastMCP
+
+        mcp = FastMCP("test-server")
+        resources.register_task_resources(mcp)
+
+        text = (await mcp.read_resource("tasks://all"))[0].content
+
+        assert text.startswith("All Tasks (2 items)\n\nSubject: Active Task\n")
+        assert text.count("-" * 60) == 2
+        assert text.endswith("Entry ID: task-456\n\n" + "-" * 60)
+
     def test_tasks_all_resource(self, set_bridge, mock_bridge):
         """Test tasks://all resource"""
         # Register resources with mock MCP server
@@ -202,6 +202,26 @@ class TestListEmails:
             limit=10, folder="Sent Items", include_non_mail=False
         )
 
+    def test_list_emails_validation_opt_in(
+        self, server_with_mock, mock_bridge, monkeypatch
+    ):
+        """Test that the whole list is validated only with MAILTOOL_VALIDATE set"""
+        from pydantic import ValidationError
+
+        from mailtool.mcp.server import list_emails
+
+        mock_bridge.list_emails.return_value.append(
+            {"entry_id": "email-456", "unread": "not-a-bool"}
+        )
+
+        result = list_emails()
+        assert [e.entry_id for e in result] == ["email-123", "email-456"]
+        assert result[1].subject == ""  # required-field fallback
+
+        monkeypatch.setattr(server_with_mock, "_VALIDATE", True)
+        with pytest.raises(ValidationError):
+            list_emails()
+
 
 class TestGetEmail:
     """Test get_email tool"""
@@ -217,6 +237,31 @@ class TestGetEmail:
         assert result.body == "Test body"
         mock_bridge.get_email_body.assert_called_once_with("email-123")
 
+    def test_get_email_validation_opt_in(
+        self, server_with_mock, mock_bridge, monkeypatch
+    ):
+        """Test that unvalidated bridge data still keeps its typed fields' types"""
+        from pydantic import ValidationError
+
+        from mailtool.mcp.server import get_email
+
+        mock_bridge.get_email_body.return_value = {
+            **mock_bridge.get_email_body.return_value,
+            "has_attachments": "not-a-bool",
+            "attachments": [{"filename": "a.pdf", "size": 12.0, "is_inline": None}],
+        }
+
+        result = get_email("email-123")
+        assert result.has_attachments is True
+        assert result.attachments[0].size == 12
+        assert type(result.attachments[0].size) is int
+        assert result.attachments[0].is_inline is False
+        assert result.message_class == "IPM.Note"  # model default
+
+        monkeypatch.setattr(server_with_mock, "_VALIDATE", True)
+        with pytest.raises(ValidationError):
+            get_email("email-123")
+
     def test_get_email_not_found(self, server_with_mock, mock_bridge):
         """Test get_email with invalid entry_id"""
         from mcp import McpError
@@ -389,6 +434,43 @@ class TestSearchEmails:
         assert isinstance(result, list)
         mock_bridge.search_emails.assert_called_once()
 
+    def test_search_emails_shares_cache_with_unread(
+        self, server_with_mock, mock_bridge
+    ):
+        """Test that equivalent queries from both tools hit one cache entry"""
+        from mailtool.mcp.server import list_unread_emails, search_emails
+
+        list_unread_emails(limit=3)
+        search_emails("[Unread]  =  TRUE", limit=3)
+        assert mock_bridge.search_emails.call_count == 1
+
+        search_emails("[Unread] = TRUE", limit=3, include_non_mail=True)
+        assert mock_bridge.search_emails.call_count == 2
+
+    def test_search_cache_keeps_whitespace_in_literals(
+        self, server_with_mock, mock_bridge
+    ):
+        """Test that whitespace inside quoted values still tells queries apart"""
+        from mailtool.mcp.server import search_emails
+
+        search_emails("[Subject] = 'a  b'", limit=3)
+        search_emails("[Subject]  =  'a  b'", limit=3)
+        assert mock_bridge.search_emails.call_count == 1
+
+        search_emails("[Subject] = 'a b'", limit=3)
+        assert mock_bridge.search_emails.call_count == 2
+
+    def test_search_cache_is_bounded(self, server_with_mock, mock_bridge):
+        """Test that the oldest entries are evicted past the size limit"""
+        server = server_with_mock
+
+        for i in range(server._SEARCH_CACHE_SIZE + 1):
+            server.search_emails(f"[Subject] = 'q{i}'", limit=1)
+        assert len(server._search_cache) == server._SEARCH_CACHE_SIZE
+
+        server.search_emails("[Subject] = 'q0'", limit=1)
+        assert mock_bridge.search_emails.call_count == server._SEARCH_CACHE_SIZE + 2
+
 
 class TestSearchEmailsBySender:
     """Test search_emails_by_sender tool"""
@@ -478,6 +560,30 @@ class TestListUnreadEmails:
             filter_query="[Unread] = TRUE", limit=5
         )
 
+    def test_list_unread_emails_cached_until_inbox_changes(
+        self, server_with_mock, mock_bridge
+    ):
+        """Test that repeated polls reuse the result until the inbox changes"""
+        from mailtool.mcp.server import list_unread_emails, mark_email
+
+        list_unread_emails(limit=7)
+        list_unread_emails(limit=7)
+        assert mock_bridge.search_emails.call_count == 1
+
+        mark_email("email-123", unread=False)
+        list_unread_emails(limit=7)
+        assert mock_bridge.search_emails.call_count == 2
+
+    def test_search_ttl_env(self, server_with_mock, monkeypatch):
+        """Test MAILTOOL_SEARCH_TTL parsing"""
+        server = server_with_mock
+        monkeypatch.setenv(server.SEARCH_TTL_ENV, "0")
+        assert server._search_ttl() == 0
+        monkeypatch.setenv(server.SEARCH_TTL_ENV, "-1")
+        assert server._search_ttl() == server.DEFAULT_SEARCH_TTL
+        monkeypatch.setenv(server.SEARCH_TTL_ENV, "soon")
+        assert server._search_ttl() == server.DEFAULT_SEARCH_TTL
+
 
 # =============================================================================
 # Calendar Tool Tests
@@ -547,6 +653,48 @@ class TestGetAppointment:
             # This is a known issue in server code
             pass
 
+    def test_get_appointment_cached_until_edited(self, server_with_mock, mock_bridge):
+        """Test that repeat fetches reuse the result until the item changes"""
+        from mailtool.mcp.server import edit_appointment, get_appointment
+
+        first = get_appointment("apt-123")
+        assert get_appointment("apt-123") is first
+        mock_bridge.get_appointment.assert_called_once_with("apt-123")
+
+        edit_appointment("apt-123", subject="Moved")
+        assert get_appointment("apt-123") is not first
+        assert mock_bridge.get_appointment.call_count == 2
+
+    def test_item_cache_disabled_and_bounded(
+        self, server_with_mock, mock_bridge, monkeypatch
+    ):
+        """Test MAILTOOL_CACHE_TTL=0 and the item cache size limit"""
+        server = server_with_mock
+
+        monkeypatch.setattr(server, "_CACHE_TTL", 0)
+        server.get_appointment("apt-123")
+        server.get_appointment("apt-123")
+        assert mock_bridge.get_appointment.call_count == 2
+
+        monkeypatch.setattr(server, "_CACHE_TTL", 30.0)
+        for i in range(server._ITEM_CACHE_SIZE + 5):
+            server.get_task(f"task-{i}")
+        assert len(server._item_cache) == server._ITEM_CACHE_SIZE
+
+    def test_clear_caches_drops_bridge_references(self, server_with_mock, mock_bridge):
+        """Test that _clear_caches (called at shutdown) empties every cache"""
+        server = server_with_mock
+        server.get_appointment("apt-123")
+        server.list_tasks()
+        server.search_emails("[Subject] = 'x'")
+
+        server._clear_caches()
+
+        assert not server._item_cache
+        assert not server._task_list_cache
+        assert not server._search_cache
+        assert not server._recent_creates
+
 
 class TestCreateAppointment:
     """Test create_appointment tool"""
@@ -580,6 +728,69 @@ class TestCreateAppointment:
 
         assert result.success is False
 
+    def test_create_appointment_parses_timestamps(self, server_with_mock, mock_bridge):
+        """Test that timestamps reach the bridge as datetimes"""
+        from datetime import datetime
+
+        from mailtool.mcp.server import create_appointment
+
+        create_appointment(
+            subject="Test Meeting",
+            start="2025-01-20 14:00:00",
+            end="2025-01-20 15:00:00",
+        )
+
+        kwargs = mock_bridge.create_appointment.call_args.kwargs
+        assert kwargs["start"] == datetime(2025, 1, 20, 14)
+        assert kwargs["end"] == datetime(2025, 1, 20, 15)
+
+    @pytest.mark.parametrize(
+        "start",
+        [
+            "tomorrow",
+            "2025-13-01 10:00:00",
+            "2025-01-20 14:00:00+02:00",
+            # Date-only would otherwise become midnight
+            "2025-01-20",
+            "2025-01-20T14",
+            "2025-01-20 14:00:00.500",
+        ],
+    )
+    def test_create_appointment_rejects_bad_timestamp(
+        self, server_with_mock, mock_bridge, start
+    ):
+        """Test that invalid timestamps are rejected before the COM call"""
+        from mailtool.mcp.exceptions import OutlookValidationError
+        from mailtool.mcp.server import create_appointment
+
+        with pytest.raises(OutlookValidationError) as exc_info:
+            create_appointment(
+                subject="Test Meeting", start=start, end="2025-01-20 15:00:00"
+            )
+
+        assert exc_info.value.field == "start"
+        mock_bridge.create_appointment.assert_not_called()
+
+    def test_create_appointment_retry_deduplicated(self, server_with_mock, mock_bridge):
+        """Test that a retry with the same idempotency_key creates nothing new"""
+        from mailtool.mcp.server import create_appointment
+
+        args = {"subject": "Test Meeting", "end": "2025-01-20 15:00:00"}
+        first = create_appointment(
+            start="2025-01-20 14:00:00", idempotency_key="k1", **args
+        )
+        retry = create_appointment(
+            start="2025-01-20 14:00:00", idempotency_key="k1", **args
+        )
+
+        assert retry.entry_id == first.entry_id == "new-apt-456"
+        mock_bridge.create_appointment.assert_called_once()
+
+        # Without a key, identical calls are deliberate and each one creates
+        create_appointment(start="2025-01-20 14:00:00", **args)
+        create_appointment(start="2025-01-20 14:00:00", **args)
+        assert mock_bridge.create_appointment.call_count == 3
+
 
 class TestEditAppointment:
     """Test edit_appointment tool"""
@@ -613,8 +824,29 @@ class TestRespondToMeeting:
         result = respond_to_meeting("apt-123", "decline")
 
         assert result.success is True
+        assert result.message == "Meeting declined successfully"
         mock_bridge.respond_to_meeting.assert_called_once_with("apt-123", "decline")
 
+    def test_respond_tentative_normalized(self, server_with_mock, mock_bridge):
+        """Test that the response is lower-cased before reaching the bridge"""
+        from mailtool.mcp.server import respond_to_meeting
+
+        result = respond_to_meeting("apt-123", "Tentative")
+
+        assert result.message == "Meeting tentatively accepted successfully"
+        mock_bridge.respond_to_meeting.assert_called_once_with("apt-123", "tentative")
+
+    def test_respond_invalid_response(self, server_with_mock, mock_bridge):
+        """Test that unknown responses are rejected before the COM call"""
+        from mailtool.mcp.exceptions import OutlookValidationError
+        from mailtool.mcp.server import respond_to_meeting
+
+        with pytest.raises(OutlookValidationError) as exc_info:
+            respond_to_meeting("apt-123", "maybe")
+
+        assert exc_info.value.field == "response"
+        mock_bridge.respond_to_meeting.assert_not_called()
+
 
 class TestDeleteAppointment:
     """Test delete_appointment tool"""
@@ -680,6 +912,57 @@ class TestListTasks:
         assert isinstance(result, list)
         mock_bridge.list_tasks.assert_called_once_with(include_completed=True)
 
+    def test_list_tasks_validation_opt_in(
+        self, server_with_mock, mock_bridge, monkeypatch
+    ):
+        """Test that task rows are only validated with MAILTOOL_VALIDATE set"""
+        from pydantic import ValidationError
+
+        from mailtool.mcp.server import list_tasks
+
+        mock_bridge.list_tasks.return_value = [
+            {
+                **mock_bridge.list_tasks.return_value[0],
+                "complete": "not-a-bool",
+                "priority": 2.0,
+                "percent_complete": 50,
+                "status": None,
+            }
+        ]
+
+        result = list_tasks()
+        assert result[0].complete is True
+        assert type(result[0].priority) is int
+        assert type(result[0].percent_complete) is float
+        assert result[0].status is None
+
+        monkeypatch.setattr(server_with_mock, "_VALIDATE", True)
+        server_with_mock._invalidate_task_lists()
+        with pytest.raises(ValidationError):
+            list_tasks()
+
+    def test_task_lists_shared_until_tasks_change(self, server_with_mock, mock_bridge):
+        """Test that list_all_tasks reuses list_tasks(include_completed=True)"""
+        from pydantic import ValidationError
+
+        from mailtool.mcp.server import complete_task, list_all_tasks, list_tasks
+
+        first = list_tasks(include_completed=True)
+        expected = list(first)
+        first.clear()
+        second = list_all_tasks()
+        assert second == expected
+        mock_bridge.list_tasks.assert_called_once_with(include_completed=True)
+        with pytest.raises(ValidationError):
+            second[0].complete = True
+
+        list_tasks()
+        assert mock_bridge.list_tasks.call_count == 2
+
+        complete_task("task-123")
+        list_all_tasks()
+        assert mock_bridge.list_tasks.call_count == 3
+
 
 class TestListAllTasks:
     """Test list_all_tasks tool"""
@@ -758,6 +1041,46 @@ class TestCreateTask:
 
         assert result.success is False
 
+    def test_create_task_due_date(self, server_with_mock, mock_bridge):
+        """Test that due dates are parsed to noon and invalid ones rejected"""
+        from datetime import datetime
+
+        from mailtool.mcp.exceptions import OutlookValidationError
+        from mailtool.mcp.server import create_task
+
+        create_task(subject="Test Task", due_date="2025-01-25")
+        kwargs = mock_bridge.create_task.call_args.kwargs
+        assert kwargs["due_date"] == datetime(2025, 1, 25, 12)
+
+        for due_date in ("next friday", "20250125", "2025-W04-6"):
+            with pytest.raises(OutlookValidationError):
+                create_task(subject="Test Task", due_date=due_date)
+        mock_bridge.create_task.assert_called_once()
+
+    def test_create_task_retry_deduplicated(self, server_with_mock, mock_bridge):
+        """Test that a keyed retry returns the first task while it still exists"""
+        from mailtool.mcp.server import create_task, delete_task
+
+        first = create_task(subject="Test Task", idempotency_key="k1")
+        retry = create_task(subject="Test Task", idempotency_key="k1")
+
+        assert retry.success is True
+        assert retry.entry_id == first.entry_id
+        assert "idempotency_key" in retry.message
+        mock_bridge.create_task.assert_called_once()
+
+        create_task(subject="Test Task", idempotency_key="k2")
+        assert mock_bridge.create_task.call_count == 2
+
+        delete_task(first.entry_id)
+        create_task(subject="Test Task", idempotency_key="k1")
+        assert mock_bridge.create_task.call_count == 3
+
+        # Removed in Outlook itself: the cached EntryID no longer resolves
+        mock_bridge.get_item_by_id.return_value = None
+        create_task(subject="Test Task", idempotency_key="k1")
+        assert mock_bridge.create_task.call_count == 4
+
 
 class TestEditTask:
     """Test edit_task tool"""
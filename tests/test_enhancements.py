@@ -269,6 +269,16 @@ class _FakeMailItem:
         self.Attachments = _FakeAttachments([_FakeAttachment("a.pdf", 1234)])
 
 
+class _FakePropertyAccessor:
+    def __init__(self, values):
+        self.values = values
+        self.calls = 0
+
+    def GetProperties(self, schemas):  # noqa: N802 - mirrors COM PropertyAccessor
+        self.calls += 1
+        return self.values
+
+
 @pytest.mark.unit
 class TestMailItemToDict:
     def test_builds_full_dict_for_fake_mail_item(self):
@@ -294,6 +304,62 @@ class TestMailItemToDict:
         assert d["attachments"][0]["filename"] == "a.pdf"
         assert d["attachments"][0]["size"] == 1234
 
+    def test_string_fields_read_in_one_property_call(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        item = _FakeMailItem()
+        # -2147221233 (MAPI_E_NOT_FOUND) is how a missing property comes back.
+        item.PropertyAccessor = _FakePropertyAccessor(
+            (
+                "Batched",
+                "Bob",
+                "dave@example.com",
+                -2147221233,
+                "IPM.Note.SMIME",
+                True,
+            )
+        )
+        d = bridge._mail_item_to_dict(item)
+
+        assert item.PropertyAccessor.calls == 1
+        assert d["has_attachments"] is True
+        assert d["subject"] == "Batched"
+        assert d["sender_name"] == "Bob"
+        assert d["to"] == "dave@example.com"
+        assert d["cc"] == ""
+        assert d["message_class"] == "IPM.Note.SMIME"
+
+    def test_has_attachments_uses_paperclip_flag(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        item = _FakeMailItem()
+        # Inline-only attachments: Attachments.Count is 1, the flag is False
+        item.PropertyAccessor = _FakePropertyAccessor(
+            ("Hello", "Alice", "", "", "IPM.Note", False)
+        )
+
+        assert bridge._mail_item_to_dict(item)["has_attachments"] is False
+        row = bridge._mail_row_to_dict(_table_row(has_attachments=False))
+        assert row["has_attachments"] is False
+
+        # Details list the attachment, so the flag follows the list there
+        details = bridge._mail_item_to_dict(item, include_body=True)
+        assert details["has_attachments"] is True
+        assert len(details["attachments"]) == 1
+
+    def test_sender_strings_shared_across_items(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+
+        def item():
+            # Build equal but distinct string objects, as COM would return.
+            it = _FakeMailItem()
+            it.SenderName = "".join(["Al", "ice"])
+            it.SenderEmailAddress = "".join(["alice", "@example.com"])
+            return it
+
+        first = bridge._mail_item_to_dict(item())
+        second = bridge._mail_item_to_dict(item())
+        assert first["sender"] is second["sender"]
+        assert first["sender_name"] is second["sender_name"]
+
     def test_summary_mode_omits_body_fields(self):
         bridge = OutlookBridge.__new__(OutlookBridge)
         d = bridge._mail_item_to_dict(_FakeMailItem(), include_body=False)
@@ -302,6 +368,273 @@ class TestMailItemToDict:
         assert d["message_class"] == "IPM.Note"
 
 
+class _FakeRow:
+    def __init__(self, values):
+        self.values = values
+
+    def GetValues(self):  # noqa: N802 - mirrors COM Row.GetValues
+        return self.values
+
+
+class _FakeTable:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.filters = []
+        self.Columns = MagicMock()
+
+    def Restrict(self, filter_query):  # noqa: N802 - mirrors COM Table.Restrict
+        self.filters.append(filter_query)
+        return self
+
+    def Sort(self, column, descending):  # noqa: N802 - mirrors COM Table.Sort
+        self.sort = (column, descending)
+
+    @property
+    def EndOfTable(self):  # noqa: N802 - mirrors COM Table.EndOfTable
+        return not self.rows
+
+    def GetNextRow(self):  # noqa: N802 - mirrors COM Table.GetNextRow
+        return _FakeRow(self.rows.pop(0))
+
+
+def _table_row(**overrides):
+    """A _MAIL_TABLE_COLUMNS row matching _FakeMailItem."""
+    row = {
+        "entry_id": "eid-1",
+        "subject": "Hello",
+        "sender_name": "Alice",
+        "sender_type": "SMTP",
+        "sender_address": "alice@example.com",
+        "sender_smtp": None,
+        "received": datetime(2026, 7, 7, 10, 0, 0),
+        "sent": datetime(2026, 7, 7, 9, 55, 0),
+        "unread": True,
+        "has_attachments": True,
+        "message_class": "IPM.Note",
+        "to": "bob@example.com",
+        "cc": "carol@example.com",
+        "conversation_id": "conv-1",
+        "conversation_topic": "Hello",
+    }
+    row.update(overrides)
+    return tuple(row.values())
+
+
+@pytest.mark.unit
+class TestMailTable:
+    def test_rows_match_item_summaries(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        table = _FakeTable([_table_row(), _table_row(entry_id="eid-2")])
+        inbox = MagicMock()
+        inbox.GetTable.return_value = table
+        bridge._warm_inbox = inbox
+
+        emails = bridge.list_emails(limit=1, unread_only=True)
+
+        expected = bridge._mail_item_to_dict(_FakeMailItem(), include_body=False)
+        assert emails == [expected]
+        assert table.filters == [MAIL_ONLY_FILTER, "[UnRead] = True"]
+        assert table.sort == ("[ReceivedTime]", True)
+        inbox.Items.Sort.assert_not_called()
+
+    def test_unconvertible_rows_do_not_count_toward_limit(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        rows = [_table_row(), ("truncated",), _table_row(entry_id="eid-3")]
+        folder = MagicMock()
+        folder.GetTable.return_value = _FakeTable(rows)
+
+        emails = bridge._mail_table(folder, limit=2)
+
+        assert [e["entry_id"] for e in emails] == ["eid-1", "eid-3"]
+
+    def test_exchange_sender_opens_item_only_without_smtp_column(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        bridge.get_item_by_id = MagicMock(return_value=MagicMock())
+        bridge.resolve_smtp_address = MagicMock(return_value="dave@example.com")
+        ex = {"sender_type": "EX", "sender_address": "/o=Org/cn=dave"}
+
+        row = bridge._mail_row_to_dict(_table_row(sender_smtp="d@x.com", **ex))
+        assert row["sender"] == "d@x.com"
+        bridge.get_item_by_id.assert_not_called()
+
+        row = bridge._mail_row_to_dict(_table_row(sender_smtp=-2147221233, **ex))
+        assert row["sender"] == "dave@example.com"
+        bridge.get_item_by_id.assert_called_once_with("eid-1")
+
+    def test_exchange_dn_resolved_once(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        bridge.namespace = MagicMock()
+        recipient = bridge.namespace.CreateRecipient.return_value
+        user = recipient.AddressEntry.GetExchangeUser.return_value
+        user.PrimarySmtpAddress = "dave@example.com"
+        bridge.get_item_by_id = MagicMock()
+        ex = {"sender_type": "EX", "sender_address": "/o=Org/cn=dave"}
+
+        rows = [_table_row(entry_id=f"eid-{i}", **ex) for i in range(3)]
+        senders = [bridge._mail_row_to_dict(row)["sender"] for row in rows]
+
+        assert senders == ["dave@example.com"] * 3
+        bridge.namespace.CreateRecipient.assert_called_once_with("/o=Org/cn=dave")
+        bridge.get_item_by_id.assert_not_called()
+
+    def test_resolve_smtp_address_reuses_exchange_lookup(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        item = MagicMock(SenderEmailType="EX", SenderEmailAddress="/o=Org/cn=erin")
+        item.Sender.GetExchangeUser.return_value.PrimarySmtpAddress = "erin@x.com"
+
+        assert bridge.resolve_smtp_address(item) == "erin@x.com"
+        assert bridge.resolve_smtp_address(item) == "erin@x.com"
+        item.Sender.GetExchangeUser.assert_called_once()
+        assert bridge._smtp_for_exchange_dn("/o=Org/cn=erin") == "erin@x.com"
+
+    def test_falls_back_to_items_when_table_fails(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        folder = MagicMock()
+        folder.GetTable.side_effect = Exception("no Table API")
+        restricted = folder.Items.Restrict.return_value
+        restricted.__iter__.return_value = iter([_FakeMailItem()])
+        bridge.get_inbox = MagicMock(return_value=folder)
+
+        emails = bridge.search_emails("[Subject] = 'Hello'")
+
+        assert [e["entry_id"] for e in emails] == ["eid-1"]
+        restricted.Sort.assert_called_once_with("[ReceivedTime]", True)
+
+
+@pytest.mark.unit
+class TestWarmInbox:
+    def test_list_emails_uses_warm_inbox_once(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        bridge.get_inbox = MagicMock(return_value=MagicMock())
+        bridge._warm_inbox = MagicMock()
+
+        bridge.list_emails(limit=5)
+        bridge.get_inbox.assert_not_called()
+        assert bridge._warm_inbox is None
+
+        bridge.list_emails(limit=5)
+        bridge.get_inbox.assert_called_once()
+
+
+@pytest.mark.unit
+class TestFolderCache:
+    def test_folder_lookup_cached_until_account_changes(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        folder = MagicMock(Name="Archive")
+        bridge._find_folder_by_name = MagicMock(side_effect=[None, folder, folder])
+        bridge._find_root_by_name = MagicMock(return_value=MagicMock())
+        bridge.namespace = MagicMock()
+
+        # Misses are not cached, so a folder created later is still found.
+        assert bridge.get_folder_by_name("Archive") is None
+        assert bridge.get_folder_by_name("Archive") is folder
+        assert bridge.get_folder_by_name("Archive") is folder
+        assert bridge._find_folder_by_name.call_count == 2
+
+        bridge.set_default_account("Other")
+        bridge.get_folder_by_name("Archive")
+        assert bridge._find_folder_by_name.call_count == 3
+
+    def test_stale_folder_looked_up_again(self, monkeypatch):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        folder, renamed = MagicMock(Name="Archive"), MagicMock(Name="Archive")
+        bridge._find_folder_by_name = MagicMock(return_value=folder)
+        assert bridge.get_folder_by_name("archive") is folder
+        assert bridge.get_folder_by_name("archive") is folder
+        assert bridge._find_folder_by_name.call_count == 1
+
+        # Renamed in Outlook: the cached handle no longer matches the name
+        folder.Name = "Old Archive"
+        bridge._find_folder_by_name.return_value = renamed
+        assert bridge.get_folder_by_name("archive") is renamed
+
+        # Deleted: reading the cached handle fails
+        type(renamed).Name = property(lambda self: 1 / 0)
+        bridge._find_folder_by_name.return_value = None
+        assert bridge.get_folder_by_name("archive") is None
+        assert bridge._find_folder_by_name.call_count == 3
+
+        # Recreated: entries expire after _FOLDER_CACHE_TTL
+        monkeypatch.setattr(OutlookBridge, "_FOLDER_CACHE_TTL", 0)
+        bridge._find_folder_by_name.return_value = MagicMock(Name="Archive")
+        bridge.get_folder_by_name("archive")
+        bridge.get_folder_by_name("archive")
+        assert bridge._find_folder_by_name.call_count == 5
+
+    def test_calendar_and_tasks_resolved_once(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        calendar, tasks = MagicMock(), MagicMock()
+        bridge._find_calendar = MagicMock(return_value=calendar)
+        bridge._find_tasks = MagicMock(return_value=tasks)
+
+        assert bridge.get_calendar() is calendar
+        assert bridge.get_calendar() is calendar
+        assert bridge.get_tasks() is tasks
+        assert bridge.get_tasks() is tasks
+        bridge._find_calendar.assert_called_once()
+        bridge._find_tasks.assert_called_once()
+        # A folder literally named "Calendar" is looked up separately
+        bridge._find_folder_by_name = MagicMock(return_value=None)
+        assert bridge.get_folder_by_name("Calendar") is None
+
+
+@pytest.mark.unit
+class TestCalendarIteration:
+    def test_items_walked_with_get_first_get_next(self):
+        items = MagicMock()
+        items.GetFirst.return_value = "first"
+        items.GetNext.side_effect = ["second", None]
+        assert list(OutlookBridge._iter_items(items)) == ["first", "second"]
+        items.__iter__.assert_not_called()
+
+    def test_all_events_does_not_expand_recurrences(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        appointments = MagicMock()
+        appointments.GetFirst.return_value = None
+        bridge.get_calendar = MagicMock()
+        bridge.get_calendar.return_value.Items.Restrict.return_value = appointments
+
+        assert bridge.list_calendar_events(all_events=True) == []
+        assert appointments.IncludeRecurrences is False
+        appointments.Restrict.assert_not_called()
+
+    def test_date_window_left_to_restrict(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        event = MagicMock(
+            Start=datetime(2000, 1, 1, 9), End=datetime(2000, 1, 1, 10), EntryID="e1"
+        )
+        restricted = MagicMock()
+        restricted.GetFirst.return_value = event
+        restricted.GetNext.return_value = None
+        appointments = MagicMock()
+        appointments.Restrict.return_value = restricted
+        bridge.get_calendar = MagicMock()
+        bridge.get_calendar.return_value.Items.Restrict.return_value = appointments
+
+        events = bridge.list_calendar_events(days=7)
+
+        filter_str = appointments.Restrict.call_args.args[0]
+        assert filter_str.startswith("[Start] >= '")
+        assert "AND [Start] <= '" in filter_str
+        # Whatever Outlook returns for the window is kept as-is
+        assert [e["entry_id"] for e in events] == ["e1"]
+
+    def test_edit_appointment_opens_item_by_id(self):
+        bridge = OutlookBridge.__new__(OutlookBridge)
+        item = MagicMock()
+        bridge.get_item_by_id = MagicMock(return_value=item)
+        bridge.get_calendar = MagicMock()
+
+        assert bridge.edit_appointment("apt-1", start=datetime(2025, 1, 20, 14))
+        bridge.get_item_by_id.assert_called_once_with("apt-1")
+        bridge.get_calendar.assert_not_called()
+        assert item.Start == datetime(2025, 1, 20, 14)
+        item.Save.assert_called_once()
+
+        bridge.get_item_by_id.return_value = None
+        assert bridge.edit_appointment("missing", subject="x") is False
+
+
 # =============================================================================
 # New tools: get_emails, get_inbox_stats, get_email on non-mail (Phases 1, 4, 6)
 # =============================================================================